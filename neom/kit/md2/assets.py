@@ -0,0 +1,397 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Prebuilt md2 assets.
+
+The md2 stylesheet and script are templates with thousands of ``_kt`` calls.
+Rendering them on each response is expensive, so they can be rendered once
+into content-hashed files. A manifest keeps the final names and the
+keytoken manifest version they were rendered with.
+
+The files are written to ``NEOM_MD2["BUILD_DIR"]``, a source directory that
+``BuildFinder`` exposes to the static files app, and not to the static
+storage itself. ``collectstatic`` then copies them like any other static
+file, so manifest storages know their names and ``--clear`` never drops
+them. Deploys run, in order::
+
+    manage.py md2-build
+    manage.py collectstatic
+
+Each file also gets precompressed gzip and, when the standard library has
+it, zstd variants, so the assets view never compresses per response.
+"""
+
+from __future__ import annotations
+
+import base64
+import functools
+import gzip
+import hashlib
+import json
+import os
+import posixpath
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, Storage
+from django.core.signals import setting_changed
+from django.template import engines
+from django.template.loader import get_template, render_to_string
+from django.urls import reverse
+from django.utils.autoreload import file_changed
+
+from neom.kit.md2 import components
+from neom.kit.md2.conf import md2_setting
+from neom.templatetags import neom_webtools
+
+try:
+    from compression import zstd  # type: ignore[import-not-found]
+except ImportError:  # python < 3.14
+    zstd = None
+
+__all__ = [
+    "ASSETS",
+    "build",
+    "build_storage",
+    "has",
+    "icons_src",
+    "is_static",
+    "manifest",
+    "render",
+    "url",
+]
+
+ASSETS = {
+    "web.css": "neom/kit/md2/web.css",
+    "web.js": "neom/kit/md2/web.js",
+    "boot.js": "neom/kit/md2/boot.js",
+}
+
+ICONS = "icons.woff2"
+
+STATIC_PREFIX = "neom/md2"
+
+# Preferred first when the client accepts several encodings.
+ENCODINGS = {
+    "zstd": (".zst", zstd.compress if zstd else None),
+    "gzip": (".gz", lambda content: gzip.compress(content, 9, mtime=0)),
+}
+MANIFEST_NAME = posixpath.join(STATIC_PREFIX, "manifest.json")
+
+
+CRITICAL_MARKER = "<!--neom-md2-critical-->"
+
+
+def is_static() -> bool:
+    """Tell if md2 head tags must link to the built assets."""
+    return md2_setting("ASSETS", "inline") == "static"
+
+
+def is_critical() -> bool:
+    """Tell if the md2 style inlines only the rules of rendered components."""
+    return is_static() and md2_setting("STYLE", "full") == "critical"
+
+
+PRUNABLE = ("web.css",)
+
+SPLITTABLE = "web.js"
+
+
+def chunk(name: str) -> str:
+    """Asset name of a ``web.js`` chunk."""
+    return f"web.{name}.js"
+
+
+def render(name: str) -> str:
+    return render_to_string(ASSETS[name])
+
+
+# Asset name to ((source mtime, keytokens version), rendered asset).
+_rendered: Dict[str, Tuple[Tuple[int, str], str]] = {}
+_sources: Dict[str, str] = {}
+
+
+def rendered(name: str) -> str:
+    """Render an asset once, again only when its source changes.
+
+    The key is the template file mtime and the keytoken manifest version, so
+    inline mode stops rendering the assets for each page.
+    """
+    if name not in _sources:
+        _sources[name] = get_template(ASSETS[name]).origin.name
+
+    key = (os.stat(_sources[name]).st_mtime_ns, neom_webtools.VERSION)
+    cached = _rendered.get(name)
+    if cached is None or cached[0] != key:
+        cached = _rendered[name] = (key, render(name))
+    return cached[1]
+
+
+def _asset_changed(sender, file_path, **kwargs):
+    """Drop rendered assets when the autoreloader sees their source change.
+
+    The critical rules are dropped on any change, as the templates they
+    come from may be overridden anywhere.
+    """
+    _critical.cache_clear()
+    changed = Path(file_path).resolve()
+    for name, source in list(_sources.items()):
+        if Path(source).resolve() == changed:
+            _rendered.pop(name, None)
+
+
+file_changed.connect(_asset_changed, dispatch_uid="neom_md2_asset_changed")
+
+
+def render_pruned(name: str, used: Iterable[str]) -> str:
+    """Render an asset keeping only the rules for the ``used`` classes."""
+    from neom.kit.md2 import treeshake
+
+    source = get_template(ASSETS[name]).template.source
+    keep = md2_setting("KEEP", treeshake.KEEP)
+    pruned = treeshake.prune(source, used, keep)
+    return engines["django"].from_string(pruned).render()
+
+
+def critical(blocks: FrozenSet[str]) -> str:
+    """Stylesheet rules for the ``blocks`` of the rendered components."""
+    return _critical(blocks, neom_webtools.VERSION)
+
+
+@functools.lru_cache(maxsize=64)
+def _critical(blocks: FrozenSet[str], version: str) -> str:
+    """Critical rules of ``blocks`` for a keytoken manifest ``version``."""
+    return render_pruned("web.css", blocks)
+
+
+def render_chunks(name: str) -> Dict[str, str]:
+    """Render each chunk split from a script asset."""
+    from neom.kit.md2 import jssplit
+
+    source = get_template(ASSETS[name]).template.source
+    engine = engines["django"]
+    return {
+        chunk(chunk_name): engine.from_string(chunk_source).render()
+        for chunk_name, chunk_source in jssplit.split(source).items()
+    }
+
+
+@functools.cache
+def build_storage() -> FileSystemStorage:
+    """Storage of the ``NEOM_MD2["BUILD_DIR"]`` the assets are built into."""
+    location = md2_setting("BUILD_DIR")
+    if not location:
+        raise ImproperlyConfigured(
+            'NEOM_MD2["BUILD_DIR"] must be set to build the md2 assets.'
+        )
+    return FileSystemStorage(location=os.fspath(location))
+
+
+def hashed_name(name: str, content: bytes) -> str:
+    root, ext = posixpath.splitext(name)
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    return posixpath.join(STATIC_PREFIX, f"{root}.{digest}{ext}")
+
+
+def _save(storage: Storage, path: str, content: bytes):
+    if storage.exists(path):
+        storage.delete(path)
+    storage.save(path, ContentFile(content))
+
+
+def _compress(storage: Storage, path: str, content: bytes) -> Dict:
+    """Write the encoded variants that are smaller than ``content``."""
+    variants = {}
+    for encoding, (suffix, compress) in ENCODINGS.items():
+        if compress is None:
+            continue
+
+        encoded = compress(content)
+        if len(encoded) < len(content):
+            _save(storage, path + suffix, encoded)
+            variants[encoding] = {"path": path + suffix, "size": len(encoded)}
+    return variants
+
+
+def _write(storage: Storage, name: str, content: bytes, **extra) -> Dict:
+    path = hashed_name(name, content)
+    _save(storage, path, content)
+    return {
+        "path": path,
+        "sha256": hashlib.sha256(content).hexdigest(),
+        "size": len(content),
+        "encodings": _compress(storage, path, content),
+        **extra,
+    }
+
+
+def build(
+    storage: Optional[Storage] = None,
+    used: Optional[Iterable[str]] = None,
+    icons: Optional[Iterable[str]] = None,
+    split: bool = False,
+) -> Dict:
+    """Render each md2 asset and write it with a content-hashed name.
+
+    When ``used`` class names are given, prunable assets only keep the rules
+    for them and the entry records the size of the full asset. When
+    ``icons`` ligature names are given, a subset of the icons font holding
+    only them is written too. With ``split``, the script is also written as
+    per-component chunks.
+    """
+    if storage is None:
+        storage = build_storage()
+    if used is not None:
+        used = frozenset(used)
+
+    entries = {}
+    for name in ASSETS:
+        content = render(name).encode()
+        extra = {}
+        if used is not None and name in PRUNABLE:
+            extra["fullsize"] = len(content)
+            content = render_pruned(name, used).encode()
+        entries[name] = _write(storage, name, content, **extra)
+
+    if split:
+        for name, chunk in render_chunks(SPLITTABLE).items():
+            entries[name] = _write(storage, name, chunk.encode())
+
+    if icons is not None:
+        from neom.kit.md2 import fonts
+
+        icons = sorted(set(icons))
+        entries[ICONS] = _write(
+            storage, ICONS, fonts.subset(icons), names=icons
+        )
+
+    data = {
+        "assets": entries,
+        "keytokens": neom_webtools.VERSION,
+    }
+    _save(storage, MANIFEST_NAME, json.dumps(data, indent=1).encode())
+    manifest.cache_clear()
+    entries_by_path.cache_clear()
+    icons_src.cache_clear()
+    return data
+
+
+@functools.cache
+def manifest() -> Dict:
+    storage = build_storage()
+    if not storage.exists(MANIFEST_NAME):
+        raise ImproperlyConfigured(
+            f"md2 assets manifest not found: {MANIFEST_NAME}."
+            " Run `manage.py md2-build` first."
+        )
+    with storage.open(MANIFEST_NAME) as f:
+        return json.load(f)
+
+
+@functools.cache
+def entries_by_path() -> Dict[str, Dict]:
+    return {entry["path"]: entry for entry in manifest()["assets"].values()}
+
+
+def url(name: str) -> str:
+    """URL of a built asset.
+
+    With ``NEOM_MD2["SERVE"]`` the assets go through the neom assets view,
+    otherwise they are left to the static files server, through the static
+    storage of the collected copy.
+    """
+    from django.contrib.staticfiles.storage import staticfiles_storage
+
+    path = manifest()["assets"][name]["path"]
+    if md2_setting("SERVE", False):
+        return reverse("neom-md2-asset", args=(path,))
+    return staticfiles_storage.url(path)
+
+
+def has(name: str) -> bool:
+    return name in manifest()["assets"]
+
+
+@functools.cache
+def icons_src() -> str:
+    """CSS source of the icons font subset.
+
+    Subsets up to ``NEOM_MD2["ICONS_INLINE_LIMIT"]`` bytes are inlined as a
+    data url, bigger ones are linked to be cached apart from the pages.
+    """
+    entry = manifest()["assets"][ICONS]
+    if entry["size"] > md2_setting("ICONS_INLINE_LIMIT", 1024):
+        return f"url({url(ICONS)})"
+
+    with build_storage().open(entry["path"]) as f:
+        raw = base64.b64encode(f.read()).decode()
+    return f"url(data:font/woff2;base64,{raw})"
+
+
+def _settings_changed(sender, setting, **kwargs):
+    """Forget the build directory and its manifest when the settings change."""
+    if setting in ("NEOM_MD2", "STATIC_URL", "STATIC_ROOT"):
+        for function in (
+            build_storage,
+            manifest,
+            entries_by_path,
+            icons_src,
+            _critical,
+        ):
+            function.cache_clear()
+
+
+setting_changed.connect(
+    _settings_changed, dispatch_uid="neom_md2_assets_settings_changed"
+)
+
+
+def scripts(used: Iterable[str]) -> List[str]:
+    """Script assets loaded for the ``used`` components, in order."""
+    if has(chunk(components.FOUNDATION)):
+        names = [chunk(name) for name in components.scripts(used)]
+    else:
+        names = ["web.js"]
+    return [*names, "boot.js"]
+
+
+def preloads(used: Iterable[str] = ()) -> List[str]:
+    """``Link`` header values for the assets the md2 head tags load."""
+    links = [f"<{url('web.css')}>; rel=preload; as=style"]
+    if has(ICONS) and not icons_src().startswith("url(data:"):
+        links.append(
+            f"<{url(ICONS)}>; rel=preload; as=font; type=font/woff2;"
+            " crossorigin"
+        )
+    links.extend(
+        f"<{url(name)}>; rel=preload; as=script" for name in scripts(used)
+    )
+    return links
@@ -0,0 +1,133 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Choice sources searched and paged by lazy md2 selects.
+
+A source names a queryset and the fields to search in it::
+
+    choices.register("products", Product.objects.filter(active=True),
+                     search=("name", "code"))
+
+Pages are ordered by primary key and continue after the last key sent,
+so deep pages cost the same as the first one. Only authenticated users
+may read a source unless it gets its own ``allowed`` check.
+"""
+
+import functools
+import operator
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db.models import Model, Q, QuerySet
+from django.http import HttpRequest
+
+from neom.kit.md2.conf import md2_setting
+
+__all__ = ["Source", "get", "register"]
+
+LIMIT = 25
+MAX_LIMIT = 100
+MAX_QUERY = 100
+
+
+def _authenticated(request: HttpRequest) -> bool:
+    user = getattr(request, "user", None)
+    return user is not None and user.is_authenticated
+
+
+class Source:
+    def __init__(
+        self,
+        queryset: QuerySet,
+        search: Tuple[str, ...] = (),
+        to_field_name: Optional[str] = None,
+        label: Callable[[Model], str] = str,
+        allowed: Callable[[HttpRequest], bool] = _authenticated,
+    ):
+        self.queryset = queryset
+        self.search = search
+        self.to_field_name = to_field_name
+        self.label = label
+        self.allowed = allowed
+
+    def value(self, obj: Model) -> Any:
+        return getattr(obj, self.to_field_name or "pk")
+
+    def page(
+        self, query: str = "", after: Any = None, limit: Optional[int] = None
+    ) -> Tuple[List[Tuple[Any, str]], Any]:
+        """Options matching ``query`` after the key ``after``, and the next
+        key or ``None`` on the last page."""
+        limit = limit or md2_setting("CHOICES_LIMIT", LIMIT)
+        limit = max(1, min(limit, MAX_LIMIT))
+        queryset = self.queryset.order_by("pk")
+        query = query.strip()[:MAX_QUERY]
+        if query and self.search:
+            queryset = queryset.filter(
+                functools.reduce(
+                    operator.or_,
+                    (
+                        Q(**{f"{name}__icontains": query})
+                        for name in self.search
+                    ),
+                )
+            )
+        if after is not None:
+            queryset = queryset.filter(pk__gt=after)
+
+        objs = list(queryset[: limit + 1])
+        more = len(objs) > limit
+        objs = objs[:limit]
+        options = [(self.value(obj), self.label(obj)) for obj in objs]
+        return options, objs[-1].pk if more else None
+
+    def selected(self, values: Iterable[Any]) -> List[Tuple[Any, str]]:
+        """Options for the submitted or initial ``values``."""
+        values = [value for value in values if value not in (None, "")]
+        if not values:
+            return []
+        key = self.to_field_name or "pk"
+        try:
+            objs = self.queryset.filter(**{f"{key}__in": values})
+            return [(self.value(obj), self.label(obj)) for obj in objs]
+        except (ValidationError, ValueError, TypeError):
+            return []
+
+
+_sources: Dict[str, Source] = {}
+
+
+def register(name: str, queryset: QuerySet, **kwargs) -> Source:
+    """Make ``queryset`` searchable under ``name``."""
+    source = _sources[name] = Source(queryset, **kwargs)
+    return source
+
+
+def get(name: str) -> Source:
+    return _sources[name]
@@ -0,0 +1,84 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""md2 components and the assets they need."""
+
+from typing import FrozenSet, Iterable, List
+
+__all__ = ["FOUNDATION", "SCRIPTS", "STYLES", "scripts", "styles"]
+
+# Script chunk with the webpack runtime and shared modules, loaded first.
+FOUNDATION = "foundation"
+
+# Component to the script chunks initialising it.
+SCRIPTS = {
+    "button": ("ripple",),
+    "select": ("select",),
+    "textfield": ("textfield",),
+}
+
+# Component to the stylesheet blocks styling it.
+STYLES = {
+    "button": ("mdc-button",),
+    "card": ("mdc-card",),
+    "datatable": ("mdc-data-table",),
+    "select": (
+        "mdc-floating-label",
+        "mdc-line-ripple",
+        "mdc-list",
+        "mdc-list-item",
+        "mdc-menu",
+        "mdc-menu-surface",
+        "mdc-notched-outline",
+        "mdc-select",
+    ),
+    "textfield": (
+        "mdc-floating-label",
+        "mdc-line-ripple",
+        "mdc-notched-outline",
+        "mdc-text-field",
+    ),
+}
+
+
+def scripts(components: Iterable[str]) -> List[str]:
+    """Script chunks for ``components``, in loading order."""
+    chunks = {
+        chunk
+        for component in components
+        for chunk in SCRIPTS.get(component, ())
+    }
+    return [FOUNDATION, *sorted(chunks)] if chunks else []
+
+
+def styles(components: Iterable[str]) -> FrozenSet[str]:
+    """Stylesheet blocks for ``components``."""
+    return frozenset(
+        block for component in components for block in STYLES.get(component, ())
+    )
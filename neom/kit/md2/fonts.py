@@ -0,0 +1,159 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Material Icons font subsetting."""
+
+from __future__ import annotations
+
+import base64
+import io
+from pathlib import Path
+from typing import Dict, Iterable, Set
+
+from django.core.exceptions import ImproperlyConfigured
+
+try:
+    from fontTools import subset as font_subset
+    from fontTools.ttLib import TTFont
+except ImportError as error:
+    raise ImproperlyConfigured(
+        "fonttools package not installed, install neompy-et[md2-build]"
+    ) from error
+
+try:
+    import brotli  # noqa: F401 (woff2 compression)
+except ImportError as error:
+    raise ImproperlyConfigured(
+        "brotli package not installed, install neompy-et[md2-build]"
+    ) from error
+
+__all__ = ["subset"]
+
+RAW_PATH = Path(__file__).parent / "templatetags" / "_icons.raw"
+
+
+def _ligature_tables(font: TTFont, featured: bool = False):
+    """Ligature subtables, only those a feature applies when ``featured``."""
+    gsub = font["GSUB"].table
+    lookups = gsub.LookupList.Lookup if gsub.LookupList else []
+    if featured:
+        indices = {
+            index
+            for record in (
+                gsub.FeatureList.FeatureRecord if gsub.FeatureList else []
+            )
+            for index in record.Feature.LookupListIndex
+        }
+        lookups = [lookups[index] for index in sorted(indices)]
+
+    for lookup in lookups:
+        for table in lookup.SubTable:
+            if lookup.LookupType == 7:
+                table = table.ExtSubTable
+            if table.LookupType == 4:
+                yield table
+
+
+def _spelling(font: TTFont) -> Dict[str, str]:
+    cmap = font.getBestCmap() or {}
+    return {glyph: chr(code) for code, glyph in cmap.items()}
+
+
+def ligatures(font: TTFont) -> Dict[str, str]:
+    """Glyph of each ligature name the ``font`` features substitute."""
+    spelling = _spelling(font)
+    names: Dict[str, str] = {}
+    for table in _ligature_tables(font, featured=True):
+        for first, entries in table.ligatures.items():
+            for ligature in entries:
+                name = "".join(
+                    spelling.get(glyph, "")
+                    for glyph in (first, *ligature.Component)
+                )
+                names.setdefault(name, ligature.LigGlyph)
+    return names
+
+
+def _prune_ligatures(font: TTFont, names: Set[str]) -> Set[str]:
+    """Drop the ligatures not spelling ``names`` and return the kept glyphs."""
+    spelling = _spelling(font)
+    glyphs: Set[str] = set()
+
+    for table in _ligature_tables(font):
+        for first, entries in list(table.ligatures.items()):
+            kept = [
+                ligature
+                for ligature in entries
+                if "".join(
+                    spelling.get(glyph, "")
+                    for glyph in (first, *ligature.Component)
+                )
+                in names
+            ]
+            if kept:
+                table.ligatures[first] = kept
+                glyphs.update(ligature.LigGlyph for ligature in kept)
+            else:
+                del table.ligatures[first]
+
+    return glyphs
+
+
+def subset(names: Iterable[str]) -> bytes:
+    """Build a woff2 Material Icons font holding only ``names`` ligatures.
+
+    The icon ligatures are required ones (``rlig``), so that feature is kept
+    with ``liga``. The subset is checked to still map every kept name to
+    its icon glyph.
+    """
+    names = set(names)
+    font = TTFont(io.BytesIO(base64.b64decode(RAW_PATH.read_bytes())))
+    glyphs = _prune_ligatures(font, names)
+    expected = ligatures(font)
+
+    options = font_subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["rlig", "liga"]
+    options.notdef_outline = True
+
+    subsetter = font_subset.Subsetter(options)
+    subsetter.populate(glyphs=glyphs, text="".join(names))
+    subsetter.subset(font)
+
+    stream = io.BytesIO()
+    font.flavor = "woff2"
+    font.save(stream)
+
+    kept = ligatures(TTFont(io.BytesIO(stream.getvalue())))
+    lost = sorted(
+        name for name, glyph in expected.items() if kept.get(name) != glyph
+    )
+    if lost:
+        raise ValueError(f"icons subset lost ligatures: {', '.join(lost)}")
+    return stream.getvalue()
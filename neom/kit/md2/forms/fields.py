@@ -27,9 +27,26 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from typing import Callable, Dict, Optional, Type
+
+from django.db.models import fields as model_fields
 from django.forms import fields as form_fields
+from django.forms import models as model_forms
+
+from neom.kit.md2 import choices
+from neom.kit.md2.forms import widgets as md2_widgets
+
+__all__ = (
+    "TextField",
+    "SelectField",
+    "LazySelectField",
+    "formfield",
+    "register",
+)
 
-__all__ = ("TextField", "SelectField")
+FormFieldFactory = Callable[..., Optional[form_fields.Field]]
+
+_factories: Dict[Type[model_fields.Field], FormFieldFactory] = {}
 
 
 class AttachFieldMixin(form_fields.Field):
@@ -45,3 +62,60 @@ class TextField(form_fields.CharField, AttachFieldMixin):
 
 class SelectField(form_fields.TypedChoiceField, AttachFieldMixin):
     pass
+
+
+class LazySelectField(model_forms.ModelChoiceField, AttachFieldMixin):
+    """Choice of a registered :mod:`~neom.kit.md2.choices` source.
+
+    Submitted values are still checked against the source queryset.
+    """
+
+    widget = md2_widgets.LazySelect
+
+    def __init__(self, source: str, **kwargs):
+        choice_source = choices.get(source)
+        kwargs.setdefault("to_field_name", choice_source.to_field_name)
+        super().__init__(choice_source.queryset, **kwargs)
+        self.widget.source = source
+
+
+def register(model_field: Type[model_fields.Field]):
+    """Build the md2 form fields of ``model_field`` and its subclasses.
+
+    The factory takes the model field and the form field arguments, and may
+    return ``None`` to defer to the next class in the model field's MRO.
+    """
+
+    def decorator(factory: FormFieldFactory) -> FormFieldFactory:
+        _factories[model_field] = factory
+        return factory
+
+    return decorator
+
+
+def formfield(field: model_fields.Field, **kwargs) -> form_fields.Field:
+    """md2 form field for the model ``field``."""
+    for cls in type(field).__mro__:
+        factory = _factories.get(cls)
+        if factory is not None:
+            built = factory(field, **kwargs)
+            if built is not None:
+                return built
+    return field.formfield(**kwargs)
+
+
+@register(model_fields.CharField)
+def _char_formfield(field, **kwargs):
+    return TextField(**kwargs, widget=md2_widgets.TextInput)
+
+
+@register(model_fields.IntegerField)
+def _integer_formfield(field, **kwargs):
+    if field.choices:
+        return SelectField(
+            choices=field.choices,
+            coerce=field.to_python,
+            **kwargs,
+            widget=md2_widgets.Select,
+        )
+    return None
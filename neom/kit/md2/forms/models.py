@@ -27,10 +27,11 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from django.core.exceptions import ValidationError
 from django.forms import models as model_forms
 from django.forms import utils as util_forms
 
-__all__ = ["ModelForm"]
+__all__ = ["BaseModelFormSet", "ModelForm"]
 
 
 class Md2RenderableFormMixin(util_forms.RenderableMixin):
@@ -41,3 +42,46 @@ class Md2RenderableFormMixin(util_forms.RenderableMixin):
 
 class ModelForm(model_forms.ModelForm, Md2RenderableFormMixin):
     template_name_md2 = "neom/kit/md2/forms/md2.html"
+
+
+class _ExistingObjectField(model_forms.ModelChoiceField):
+    """Primary key field resolved against the objects of its formset."""
+
+    def __init__(self, formset: model_forms.BaseModelFormSet, **kwargs):
+        super().__init__(**kwargs)
+        self.formset = formset
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        try:
+            pk = self.queryset.model._meta.pk.to_python(value)
+        except ValidationError:
+            pk = None
+        obj = self.formset._existing_object(pk)
+        if obj is None:
+            raise ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+        return obj
+
+
+class BaseModelFormSet(model_forms.BaseModelFormSet, Md2RenderableFormMixin):
+    """Model formset fetching its objects in a single query."""
+
+    template_name_md2 = "neom/kit/md2/forms/formset.html"
+
+    def add_fields(self, form, index):
+        super().add_fields(form, index)
+        name = self._pk_field.name
+        field = form.fields.get(name)
+        if type(field) is model_forms.ModelChoiceField:
+            form.fields[name] = _ExistingObjectField(
+                self,
+                queryset=field.queryset,
+                initial=field.initial,
+                required=False,
+                widget=field.widget,
+            )
@@ -0,0 +1,155 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Form renderer with the md2 form templates compiled ahead.
+
+Opt in with ``FORM_RENDERER = "neom.kit.md2.forms.renderers.Md2Renderer"``.
+Each md2 form and widget template has its text and ``_kt`` classes joined
+into plain strings once, down through ``if`` and ``for`` bodies, and the
+templates it includes by name inlined. Rendering a form then only evaluates
+the nodes that depend on the field. The output is the same as with
+``TemplatesSetting``.
+"""
+
+import copy
+import functools
+from typing import Optional
+
+from django.forms.renderers import TemplatesSetting
+from django.template.backends.django import Template as BackendTemplate
+from django.template.base import Node, NodeList, Template, TextNode
+from django.template.context import Context, make_context
+from django.template.defaulttags import IfNode
+from django.template.loader_tags import (
+    ExtendsNode,
+    IncludeNode,
+    construct_relative_path,
+)
+from django.utils.safestring import SafeString
+
+from neom.kit.template.loaders import is_constant
+
+__all__ = ["Md2Renderer"]
+
+PREFIX = "neom/kit/md2/forms/"
+
+
+def _included(node: Node, template: Template) -> Optional[NodeList]:
+    """Nodes of a template included by literal name into the same context."""
+    if not (
+        isinstance(node, IncludeNode)
+        and isinstance(node.template.var, str)
+        and not node.template.filters
+        and not node.extra_context
+        and not node.isolated_context
+    ):
+        return None
+
+    name = construct_relative_path(
+        template.origin.template_name, node.template.var
+    )
+    included = template.engine.get_template(name)
+    if any(isinstance(child, ExtendsNode) for child in included.nodelist):
+        return None
+    return included.nodelist
+
+
+def _fold(nodelist: NodeList, template: Template, context: Context) -> NodeList:
+    """Copy of ``nodelist`` with constant nodes joined into text nodes."""
+    folded = NodeList()
+
+    def add(node: Node):
+        if not is_constant(node):
+            folded.append(node)
+            return
+        text = node.render_annotated(context)
+        if folded and isinstance(folded[-1], TextNode):
+            text = folded.pop().s + text
+        if text:
+            folded.append(TextNode(text))
+
+    for node in nodelist:
+        included = _included(node, template)
+        if included is not None:
+            for child in _fold(included, template, context):
+                add(child)
+            continue
+
+        if is_constant(node):
+            add(node)
+            continue
+
+        node = copy.copy(node)
+        if isinstance(node, IfNode):
+            node.conditions_nodelists = [
+                (condition, _fold(body, template, context))
+                for condition, body in node.conditions_nodelists
+            ]
+        else:
+            for name in node.child_nodelists:
+                body = getattr(node, name, None)
+                if isinstance(body, NodeList):
+                    setattr(node, name, _fold(body, template, context))
+        add(node)
+
+    return folded
+
+
+class CompiledTemplate:
+    """Template whose constant nodes are rendered ahead into strings."""
+
+    def __init__(self, template: Template):
+        self.template = template
+        context = Context(autoescape=template.engine.autoescape)
+        self.nodelist = _fold(template.nodelist, template, context)
+
+    def render(self, context=None, request=None) -> SafeString:
+        template = self.template
+        context = make_context(
+            context, request, autoescape=template.engine.autoescape
+        )
+        state = context.render_context.push_state(template)
+        with state, context.bind_template(template):
+            context.template_name = template.name
+            return SafeString(self.nodelist.render(context))
+
+
+@functools.lru_cache(maxsize=64)
+def compiled(template: Template) -> CompiledTemplate:
+    return CompiledTemplate(template)
+
+
+class Md2Renderer(TemplatesSetting):
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+        if template_name.startswith(PREFIX) and isinstance(
+            template, BackendTemplate
+        ):
+            return compiled(template.template)
+        return template
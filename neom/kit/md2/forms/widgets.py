@@ -27,13 +27,21 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from typing import Optional, Tuple
+
 from django.forms import widgets as form_widgets
+from django.urls import reverse
+
+from neom.kit.md2 import choices
+from neom.kit.template import needs
 
 
 class WidgetBaseMixin(form_widgets.Widget):
     field = None
+    needs: Tuple[str, ...] = ()
 
     def get_context(self, name, value, attrs):
+        needs.add(*self.needs)
         context = super().get_context(name, value, attrs)
         context["field"] = self.field
         return context
@@ -41,7 +49,52 @@ class WidgetBaseMixin(form_widgets.Widget):
 
 class TextInput(form_widgets.TextInput, WidgetBaseMixin):
     template_name = "neom/kit/md2/forms/widgets/input.html"
+    needs = ("textfield",)
 
 
 class Select(form_widgets.Select, WidgetBaseMixin):
     template_name = "neom/kit/md2/forms/widgets/select.html"
+    needs = ("select",)
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        context["widget"]["selected"] = next(
+            (
+                option
+                for _, options, _ in context["widget"]["optgroups"]
+                for option in options
+                if option["selected"]
+            ),
+            None,
+        )
+        return context
+
+
+class LazySelect(Select):
+    """Select rendering only its selected option.
+
+    The others are searched and paged from the choice ``source`` while the
+    menu is open.
+    """
+
+    source: Optional[str] = None
+
+    def optgroups(self, name, value, attrs=None):
+        selected = choices.get(self.source).selected(value)
+        return [
+            (
+                None,
+                [
+                    self.create_option(name, key, label, True, index, attrs)
+                    for index, (key, label) in enumerate(selected)
+                ],
+                0,
+            )
+        ]
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        context["widget"]["source"] = reverse(
+            "neom-md2-choices", args=[self.source]
+        )
+        return context
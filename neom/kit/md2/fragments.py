@@ -0,0 +1,122 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Fragment cache for md2 markup.
+
+Rendered fragments live in the Django cache named by ``NEOM_MD2["CACHE"]``
+(``"default"`` if unset), under keys versioned by the keytoken manifest.
+Each entry keeps the components its markup needs, so a cached card still
+brings its styles and scripts. An expired fragment stays around for
+``GRACE`` seconds: one worker takes a lock to render it again while the
+others keep serving the stale copy.
+"""
+
+import hashlib
+import time
+from typing import List
+
+from django.core.cache import BaseCache, caches
+from django.template import Node, NodeList, TemplateSyntaxError
+from django.template.base import FilterExpression
+
+from neom.kit.md2.conf import md2_setting
+from neom.kit.template import needs
+from neom.templatetags import neom_webtools
+
+__all__ = ["FragmentCacheNode", "cache_key"]
+
+GRACE = 60
+LOCK_TIMEOUT = 30
+
+
+def fragments() -> BaseCache:
+    return caches[md2_setting("CACHE", "default")]
+
+
+def cache_key(name: str, vary: List[object]) -> str:
+    digest = hashlib.md5(":".join(map(str, vary)).encode()).hexdigest()
+    return f"neom:md2:{neom_webtools.VERSION}:{name}:{digest}"
+
+
+class FragmentCacheNode(Node):
+    child_nodelists = ("nodelist",)
+
+    def __init__(
+        self,
+        nodelist: NodeList,
+        name: FilterExpression,
+        timeout: FilterExpression,
+        vary: List[FilterExpression],
+    ):
+        self.nodelist = nodelist
+        self.name = name
+        self.timeout = timeout
+        self.vary = vary
+
+    def render(self, context) -> str:
+        timeout = self.timeout.resolve(context)
+        try:
+            timeout = int(timeout)
+        except (ValueError, TypeError) as error:
+            raise TemplateSyntaxError(
+                f'"neom_md2_cache" timeout must be an integer: {timeout!r}'
+            ) from error
+
+        key = cache_key(
+            self.name.resolve(context),
+            [value.resolve(context) for value in self.vary],
+        )
+        cache = fragments()
+        entry = cache.get(key)
+        if entry is not None and time.time() < entry[0]:
+            return self._serve(entry)
+
+        lock = f"{key}:lock"
+        locked = cache.add(lock, True, LOCK_TIMEOUT)
+        if not locked and entry is not None:
+            return self._serve(entry)
+
+        try:
+            with needs.capture() as names:
+                html = self.nodelist.render(context)
+            cache.set(
+                key,
+                (time.time() + timeout, frozenset(names), html),
+                timeout + GRACE,
+            )
+        finally:
+            if locked:
+                cache.delete(lock)
+        return html
+
+    @staticmethod
+    def _serve(entry) -> str:
+        _, names, html = entry
+        needs.add(*names)
+        return html
@@ -0,0 +1,213 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Jinja2 extension for the md2 kit.
+
+Enable it in the ``extensions`` option of the Jinja2 backend::
+
+    "neom.kit.md2.jinja.Md2Extension"
+
+It adds the md2 tags with the same names and output as in Django
+templates, plus ``_kt`` and ``neom_import``. Arguments are Jinja
+expressions separated by commas, and compose tags close with
+``{% end %}``::
+
+    {% neom_md2_card_outlined %}
+      {% neom_md2_card_action_link _("Open"), url %}
+    {% end %}
+
+Single tags and ``_kt`` are also globals: ``{{ _kt("mdc-button") }}``.
+"""
+
+import posixpath
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.core.exceptions import ImproperlyConfigured
+
+try:
+    from jinja2 import nodes
+    from jinja2.ext import Extension
+    from markupsafe import Markup
+except ImportError as error:
+    raise ImproperlyConfigured(
+        "jinja2 package not installed, install neompy-et[jinja]"
+    ) from error
+
+from neom.kit.md2.templatetags.neom_md2 import register
+from neom.kit.template import needs
+from neom.templatetags.neom_webtools import keytoken
+
+__all__ = ["Md2Extension"]
+
+CALLS = {"_kt": ("single", keytoken), **register.calls}
+
+PURE: Dict[str, Tuple[Callable, Tuple[str, ...]]] = {
+    "_kt": (keytoken, ()),
+    **register.pure,
+}
+
+# Global adding the needs of folded tags when they render.
+NEEDS = "_neom_md2_needs"
+
+
+def _relative(origin: Optional[str], path: str) -> str:
+    """Resolve ``./`` and ``../`` paths against the importing template."""
+    if origin is None or not path.startswith(("./", "../")):
+        return path
+    return posixpath.normpath(posixpath.join(posixpath.dirname(origin), path))
+
+
+def _markup(call: Callable) -> Callable:
+    return lambda *args: Markup(call(*args))
+
+
+def _call(name: str, args: List[nodes.Expr]) -> nodes.Call:
+    return nodes.Call(nodes.Name(name, "load"), args, [], None, None)
+
+
+class Md2Extension(Extension):
+    """md2 tags compiled into plain Jinja nodes.
+
+    Pure tags with constant arguments, ``_kt`` among them, are rendered when
+    the template compiles. Other single tags call their global, and only
+    compose and direct tags go through the extension at render time.
+    """
+
+    tags = {*CALLS, "neom_import"}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.globals.update(
+            {
+                name: _markup(call)
+                for name, (kind, call) in CALLS.items()
+                if kind == "single"
+            }
+        )
+        environment.globals[NEEDS] = needs.add
+
+    def parse(self, parser):
+        token = next(parser.stream)
+        name = token.value
+        args: List[nodes.Expr] = []
+        while parser.stream.current.type != "block_end":
+            if args:
+                parser.stream.expect("comma")
+            args.append(parser.parse_expression())
+
+        if name == "neom_import":
+            return self._import(parser, args).set_lineno(token.lineno)
+
+        kind, _ = CALLS[name]
+        body = None
+        if kind == "compose":
+            body = parser.parse_statements(("name:end",), drop_needle=True)
+
+        folded = self._fold(name, args, body)
+        if folded is not None:
+            for node in folded:
+                node.set_lineno(token.lineno)
+            return folded
+
+        if kind == "single":
+            return nodes.Output([_call(name, args)]).set_lineno(token.lineno)
+
+        call_args = [nodes.Const(name), nodes.List(args)]
+        if kind == "compose":
+            return nodes.CallBlock(
+                self.call_method("_compose", call_args), [], [], body
+            ).set_lineno(token.lineno)
+        call_args.append(nodes.ContextReference())
+        return nodes.Output(
+            [self.call_method("_direct", call_args)]
+        ).set_lineno(token.lineno)
+
+    def _fold(
+        self,
+        name: str,
+        args: List[nodes.Expr],
+        body: Optional[List[nodes.Node]],
+    ) -> Optional[List[nodes.Node]]:
+        """Nodes of a pure call with constant arguments, rendered now."""
+        consts = [arg for arg in args if isinstance(arg, nodes.Const)]
+        if name not in PURE or len(consts) != len(args):
+            return None
+
+        call, tag_needs = PURE[name]
+        try:
+            output = call(*(arg.value for arg in consts))
+        except TypeError:
+            return None
+
+        folded: List[nodes.Node] = []
+        if tag_needs:
+            folded.append(
+                nodes.ExprStmt(
+                    _call(NEEDS, [nodes.Const(need) for need in tag_needs])
+                )
+            )
+        if body is None:
+            return [*folded, nodes.Output([nodes.TemplateData(output)])]
+
+        start, end = output
+        return [
+            *folded,
+            nodes.Output([nodes.TemplateData(start)]),
+            *body,
+            nodes.Output([nodes.TemplateData(end)]),
+        ]
+
+    def _import(self, parser, args: List[nodes.Expr]) -> nodes.Include:
+        if len(args) != 1:
+            parser.fail("neom_import tag takes one argument: the asset path")
+        (path,) = args
+        template: nodes.Expr
+        if isinstance(path, nodes.Const):
+            template = nodes.Const(_relative(parser.name, path.value))
+        else:
+            template = self.call_method(
+                "_relative", [nodes.Const(parser.name), path]
+            )
+        node = nodes.Include()
+        node.template = template
+        node.with_context = True
+        node.ignore_missing = False
+        return node
+
+    def _relative(self, origin: Optional[str], path: str) -> str:
+        return _relative(origin, path)
+
+    def _compose(self, name: str, args: List[Any], caller) -> Markup:
+        start, end = CALLS[name][1](*args)
+        return Markup("".join((start, caller(), end)))
+
+    def _direct(self, name: str, args: List[Any], context) -> Markup:
+        source = CALLS[name][1](*args)
+        template = self.environment.from_string(source)
+        return Markup(template.render(context.get_all()))
@@ -0,0 +1,298 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Split the md2 script bundle into per-component chunks.
+
+``web.js`` is the ``material-components-web`` webpack bundle: an array of
+module functions plus a small runtime. The array is cut into a foundation
+chunk, holding the runtime and the modules shared by several components,
+and a chunk per component holding the rest of its dependency closure.
+Chunks register their modules into a global table, so they can be loaded
+as deferred scripts in any combination after the foundation.
+
+The splitting runs on the template source; ``_kt`` calls are kept.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+from neom.kit.md2 import usage
+from neom.kit.md2.components import FOUNDATION
+
+__all__ = ["CHUNKS", "FOUNDATION", "split"]
+
+# Chunk name to the ``mdc`` namespace it exposes.
+CHUNKS = {
+    "ripple": "ripple",
+    "select": "select",
+    "textfield": "textField",
+}
+
+REGISTRY = "neomMd2"
+
+_ARRAY_RE = re.compile(r"(\w)\.m=(\w)=\[")
+_ENTRY_RE = re.compile(r"(\w)\(\1\.s=(\d+)\)")
+_CACHE_RE = re.compile(r"(\w)\.c=(\w)")
+_PARAMS_RE = re.compile(r"function\s*\(([^)]*)\)")
+_NAMESPACE_RE = re.compile(r"var (\w+)=\w+\(\w+\((\d+)\)\);\w+\.(\w+)=\1\b")
+
+_REGEX_AFTER = set("(,=:[!&|?{};+-*%<>~^")
+_REGEX_KEYWORDS = {
+    "return",
+    "typeof",
+    "case",
+    "do",
+    "else",
+    "in",
+    "of",
+    "new",
+    "delete",
+    "void",
+    "throw",
+    "instanceof",
+    "yield",
+    "await",
+}
+
+
+class SplitError(ValueError):
+    pass
+
+
+# -----------------------------------------------------------------------------
+# scanning
+
+
+def _skip_template(js: str, i: int) -> int:
+    i += 1
+    while js[i] != "`":
+        if js[i] == "\\":
+            i += 2
+        elif js.startswith("${", i):
+            i = _skip_group(js, i + 2)
+        else:
+            i += 1
+    return i + 1
+
+
+def _regex_allowed(js: str, i: int) -> bool:
+    j = i - 1
+    while j >= 0 and js[j].isspace():
+        j -= 1
+    if j < 0:
+        return True
+
+    char = js[j]
+    if char in "+-":
+        return js[j - 1] != char
+    if char in _REGEX_AFTER:
+        return True
+    if char.isalnum() or char in "_$":
+        start, stop = j, j + 1
+        while start > 0 and (js[start - 1].isalnum() or js[start - 1] in "_$"):
+            start -= 1
+        return js[start:stop] in _REGEX_KEYWORDS
+    return False
+
+
+def _skip_regex(js: str, i: int) -> int:
+    i += 1
+    in_class = False
+    while True:
+        char = js[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        elif char == "/" and not in_class:
+            break
+        elif char == "\n":
+            raise SplitError(f"Unterminated regex at {i}")
+        i += 1
+    i += 1
+    while js[i].isalpha():
+        i += 1
+    return i
+
+
+def _skip_group(js: str, i: int) -> int:
+    """Index after the bracket closing the group opened before ``i``."""
+    depth = 0
+    while True:
+        char = js[i]
+        if char in "\"'":
+            i = usage.skip_string(js, i)
+            continue
+        if char == "`":
+            i = _skip_template(js, i)
+            continue
+        if char == "/":
+            if js[i + 1] == "/":
+                i = js.index("\n", i)
+                continue
+            if js[i + 1] == "*":
+                i = js.index("*/", i) + 2
+                continue
+            if _regex_allowed(js, i):
+                i = _skip_regex(js, i)
+                continue
+        elif char in "([{":
+            depth += 1
+        elif char in ")]}":
+            if not depth:
+                return i + 1
+            depth -= 1
+        i += 1
+
+
+# -----------------------------------------------------------------------------
+# bundle
+
+
+class Bundle:
+    """Modules and runtime of a webpack bundle."""
+
+    def __init__(self, js: str):
+        array = _ARRAY_RE.search(js)
+        if not array:
+            raise SplitError("No webpack module array found")
+        self.require, self.modules_name = array.groups()
+
+        self.modules: List[Optional[str]] = []
+        i = array.end()
+        while js[i] != "]":
+            if js[i] == ",":
+                self.modules.append(None)
+                i += 1
+                continue
+            body = js.index("{", i)
+            end = _skip_group(js, body + 1)
+            self.modules.append(js[i:end])
+            i = end + 1 if js[end] == "," else end
+
+        entry = _ENTRY_RE.search(js, i)
+        cache = _CACHE_RE.search(js, i)
+        if not entry or not cache:
+            raise SplitError("No webpack runtime found")
+        self.entry = int(entry[2])
+        self.cache_name = cache[2]
+        begin, end = i + 1, entry.start()
+        self.runtime = js[begin:end].strip(",")
+
+    def dependencies(self, index: int) -> Set[int]:
+        module = self.modules[index]
+        if not module:
+            return set()
+        match = _PARAMS_RE.match(module)
+        if match is None:
+            raise SplitError(f"Module {index} is not a function")
+        params = match[1].split(",")
+        if len(params) < 3:
+            return set()
+        require = re.compile(rf"\b{re.escape(params[2].strip())}\((\d+)\)")
+        return {int(dep) for dep in require.findall(module)}
+
+    def closure(self, index: int) -> Set[int]:
+        seen = set()
+        stack = [index]
+        while stack:
+            current = stack.pop()
+            if current not in seen:
+                seen.add(current)
+                stack.extend(self.dependencies(current))
+        return seen
+
+    def namespaces(self) -> Dict[str, int]:
+        """Exported ``mdc`` namespaces of the entry module."""
+        entry = self.modules[self.entry] or ""
+        return {
+            namespace: int(index)
+            for _, index, namespace in _NAMESPACE_RE.findall(entry)
+        }
+
+
+def _registration(bundle: Bundle, indexes: Iterable[int]) -> str:
+    return "".join(
+        f"m[{index}]={bundle.modules[index]};" for index in sorted(indexes)
+    )
+
+
+def _foundation(bundle: Bundle, indexes: Set[int]) -> str:
+    r, n, i = bundle.require, bundle.modules_name, bundle.cache_name
+    return (
+        f"!function(g){{var {n}=g.m,{i}=g.c;function {r}(t){{if({i}[t])return"
+        f" {i}[t].exports;var e={i}[t]={{i:t,l:!1,exports:{{}}}};return"
+        f" {n}[t].call(e.exports,e,e.exports,{r}),e.l=!0,e.exports}}"
+        f"{r}.m={n},{bundle.runtime};g.r={r}}}(window.{REGISTRY}="
+        f"window.{REGISTRY}||{{m:{{}},c:{{}}}});"
+        f"!function(m){{{_registration(bundle, indexes)}}}"
+        f"(window.{REGISTRY}.m);window.mdc=window.mdc||{{}};"
+    )
+
+
+def _chunk(bundle: Bundle, indexes: Set[int], namespace: str, index: int):
+    return (
+        f"!function(m){{{_registration(bundle, indexes)}}}"
+        f"(window.{REGISTRY}.m);"
+        f"window.mdc.{namespace}=window.{REGISTRY}.r({index});"
+    )
+
+
+def split(source: str, chunks: Dict[str, str] = CHUNKS) -> Dict[str, str]:
+    """Split a ``web.js`` template source into chunk template sources."""
+    header, js = usage.mark(source)
+
+    bundle = Bundle(js)
+    namespaces = bundle.namespaces()
+
+    closures = {}
+    for name, namespace in chunks.items():
+        if namespace not in namespaces:
+            raise SplitError(f"Unknown mdc namespace: {namespace}")
+        closures[name] = bundle.closure(namespaces[namespace])
+
+    shared: Set[int] = set()
+    seen: Set[int] = set()
+    for closure in closures.values():
+        shared |= seen & closure
+        seen |= closure
+
+    sources = {FOUNDATION: _foundation(bundle, shared)}
+    for name, closure in closures.items():
+        namespace = chunks[name]
+        sources[name] = _chunk(
+            bundle, closure - shared, namespace, namespaces[namespace]
+        )
+
+    return {name: header + usage.unmark(js) for name, js in sources.items()}
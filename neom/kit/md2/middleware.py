@@ -0,0 +1,170 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import codecs
+import contextlib
+from typing import Callable, Iterable, Iterator
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.urls import NoReverseMatch, reverse
+
+from neom.kit.md2 import assets, components, minify
+from neom.kit.template import needs
+
+__all__ = ["CriticalStyleMiddleware", "MinifyMiddleware", "PreloadMiddleware"]
+
+
+def _is_html(response: HttpResponse) -> bool:
+    return response.get("Content-Type", "").startswith("text/html")
+
+
+def _navigates(request: HttpRequest) -> bool:
+    """Tell if ``request`` may load a page, out of the static and md2 URLs."""
+    if "text/html" not in request.headers.get("Accept", ""):
+        return False
+    prefixes = [settings.STATIC_URL or ""]
+    with contextlib.suppress(NoReverseMatch):
+        prefixes.append(reverse("neom-md2-asset", args=("-",))[:-1])
+    return not any(
+        prefix.startswith("/") and request.path.startswith(prefix)
+        for prefix in prefixes
+    )
+
+
+class CriticalStyleMiddleware:
+    """Inline the md2 rules of the rendered components.
+
+    Replaces the ``neom_md2_style`` marker with those rules and loads the
+    full cached stylesheet without blocking the first paint.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.get_response(request)
+
+        if response.streaming or not _is_html(response):
+            return response
+
+        marker = assets.CRITICAL_MARKER.encode(response.charset)
+        if marker not in response.content:
+            return response
+
+        css = assets.critical(components.styles(needs.collected()))
+        href = assets.url("web.css")
+        html = (
+            f"<style>{css}</style>"
+            f'<link rel="preload" href="{href}" as="style"'
+            " onload=\"this.onload=null;this.rel='stylesheet'\">"
+            f'<noscript><link rel="stylesheet" href="{href}"></noscript>'
+        )
+        response.content = response.content.replace(
+            marker, html.encode(response.charset), 1
+        )
+        if response.has_header("Content-Length"):
+            response["Content-Length"] = str(len(response.content))
+        return response
+
+
+class PreloadMiddleware:
+    """Announce the md2 assets of HTML responses with ``Link`` preloads.
+
+    Before the view runs, servers exposing an early hints callable in the
+    WSGI environ as ``wsgi.early_hints`` get the head assets to send a
+    ``103 Early Hints``, for requests accepting HTML out of the static and
+    md2 asset URLs only. The final response carries the same links plus
+    the script chunks of the rendered components, which proxies and CDNs
+    may also turn into early hints.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not assets.is_static():
+            return self.get_response(request)
+
+        early_hints = request.META.get("wsgi.early_hints")
+        if callable(early_hints) and _navigates(request):
+            early_hints([("Link", link) for link in assets.preloads()])
+
+        response = self.get_response(request)
+
+        if _is_html(response):
+            links = assets.preloads(needs.collected())
+            if response.has_header("Link"):
+                links.insert(0, response["Link"])
+            response["Link"] = ", ".join(links)
+        return response
+
+
+def _minify_stream(chunks: Iterable[bytes], charset: str) -> Iterator[bytes]:
+    decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+    minifier = minify.Minifier()
+    for chunk in chunks:
+        data = minifier.feed(decoder.decode(chunk))
+        if data:
+            yield data.encode(charset)
+    data = minifier.feed(decoder.decode(b"", final=True), final=True)
+    if data:
+        yield data.encode(charset)
+
+
+class MinifyMiddleware:
+    """Minify HTML responses, streaming ones chunk by chunk.
+
+    Place it above the middlewares that edit the HTML and below those that
+    compress it.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.get_response(request)
+
+        if not _is_html(response) or response.has_header("Content-Encoding"):
+            return response
+
+        if response.streaming:
+            if not getattr(response, "is_async", False):
+                response.streaming_content = _minify_stream(
+                    response.streaming_content, response.charset
+                )
+                del response["Content-Length"]
+            return response
+
+        response.content = minify.minify(
+            response.content.decode(response.charset)
+        ).encode(response.charset)
+        if response.has_header("Content-Length"):
+            response["Content-Length"] = str(len(response.content))
+        return response
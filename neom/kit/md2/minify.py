@@ -0,0 +1,203 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Incremental HTML minifier for md2 pages.
+
+Collapses whitespace runs, drops whitespace next to block tags and
+comments, and tidies the whitespace inside tags. The contents of ``pre``,
+``textarea``, ``script`` and ``style`` pass through untouched. Input may
+arrive in chunks split anywhere; each chunk is scanned once plus at most
+``MAX_CARRY`` characters held back from the previous one.
+"""
+
+import re
+from typing import Iterable, Iterator, Optional
+
+from neom.kit.md2 import assets
+
+__all__ = ["Minifier", "minify", "minify_chunks"]
+
+MAX_CARRY = 8192
+
+RAW = frozenset(("pre", "textarea", "script", "style"))
+
+# fmt: off
+BLOCK = frozenset(
+    (
+        "html", "head", "body", "title", "meta", "link", "script", "style",
+        "noscript", "template", "div", "p", "ul", "ol", "li", "dl", "dt",
+        "dd", "form", "fieldset", "legend", "table", "caption", "thead",
+        "tbody", "tfoot", "tr", "td", "th", "section", "header", "footer",
+        "nav", "main", "aside", "article", "h1", "h2", "h3", "h4", "h5",
+        "h6", "hr", "br", "pre", "option", "optgroup", "g", "defs",
+        "path", "polygon", "circle", "rect", "line",
+    )
+)
+# fmt: on
+
+KEEP_COMMENTS = (assets.CRITICAL_MARKER,)
+
+_SPACE_RE = re.compile(r"\s+")
+_TAG_RE = re.compile(
+    r"""<(/?)([a-zA-Z][^\s/>]*)((?:[^>"']|"[^"]*"|'[^']*')*)>|<[!?][^>]*>"""
+)
+_ATTRS_RE = re.compile(r"""("[^"]*"|'[^']*')|\s+""")
+_OPEN_RE = re.compile(r"<[a-zA-Z/!?]")
+
+
+def _attrs(attrs: str) -> str:
+    return _ATTRS_RE.sub(lambda m: m.group(1) or " ", attrs).rstrip()
+
+
+class Minifier:
+    """Minify a document fed as a sequence of text chunks."""
+
+    def __init__(self):
+        self._buffer = ""
+        self._raw: Optional[re.Pattern] = None
+        self._space = False
+        self._block = True
+
+    def feed(self, data: str, final: bool = False) -> str:
+        """Return the minified text that ``data`` completes."""
+        buffer = self._buffer + data
+        out = []
+        pos = 0
+        end = len(buffer)
+
+        while pos < end:
+            if self._raw:
+                match = self._raw.search(buffer, pos)
+                if not match:
+                    keep = end if final else max(pos, end - 12)
+                    out.append(buffer[pos:keep])
+                    pos = keep
+                    break
+                start = match.start()
+                out.append(buffer[pos:start])
+                pos = start
+                self._raw = None
+
+            lt = buffer.find("<", pos)
+            if lt == -1:
+                out.append(self._text(buffer[pos:]))
+                pos = end
+                break
+            if lt > pos:
+                out.append(self._text(buffer[pos:lt]))
+                pos = lt
+
+            if buffer.startswith("<!--", pos):
+                close = buffer.find("-->", pos + 4)
+                if close == -1:
+                    if final:
+                        out.append(self._verbatim(buffer[pos:]))
+                        pos = end
+                    break
+                stop = close + 3
+                comment = buffer[pos:stop]
+                if comment.startswith("<!--[") or comment in KEEP_COMMENTS:
+                    out.append(self._verbatim(comment))
+                pos = stop
+                continue
+
+            match = _TAG_RE.match(buffer, pos)
+            if match:
+                out.append(self._tag(match))
+                pos = match.end()
+            elif not final and (end - pos < 4 or _OPEN_RE.match(buffer, pos)):
+                break
+            else:
+                out.append(self._text("<"))
+                pos += 1
+
+        self._buffer = buffer[pos:]
+        if len(self._buffer) > MAX_CARRY or final:
+            out.append(self._verbatim(self._buffer))
+            self._buffer = ""
+        return "".join(out)
+
+    def close(self) -> str:
+        """Return the minified rest of the document."""
+        return self.feed("", final=True)
+
+    def _text(self, text: str) -> str:
+        if self._space:
+            text = " " + text
+        text = _SPACE_RE.sub(" ", text)
+        if self._block:
+            text = text.lstrip(" ")
+        self._space = text.endswith(" ")
+        if self._space:
+            text = text[:-1]
+        if text:
+            self._block = False
+        return text
+
+    def _verbatim(self, text: str) -> str:
+        if not text:
+            return ""
+        if self._space:
+            text = " " + text
+        self._space = self._block = False
+        return text
+
+    def _tag(self, match: re.Match) -> str:
+        slash, name, attrs = match.groups()
+        if name is None:
+            return self._verbatim(match.group())
+
+        html = f"<{slash}{name}{_attrs(attrs)}>"
+        name = name.lower()
+        if name in BLOCK:
+            self._space = False
+            self._block = True
+        else:
+            html = self._verbatim(html)
+        if not slash and name in RAW and not attrs.rstrip().endswith("/"):
+            self._raw = re.compile(rf"</{name}(?=[\s/>])", re.I)
+        return html
+
+
+def minify(html: str) -> str:
+    """Minify a whole document."""
+    minifier = Minifier()
+    return minifier.feed(html) + minifier.close()
+
+
+def minify_chunks(chunks: Iterable[str]) -> Iterator[str]:
+    """Minify a document given as ``chunks``, yielding as it goes."""
+    minifier = Minifier()
+    for chunk in chunks:
+        data = minifier.feed(chunk)
+        if data:
+            yield data
+    data = minifier.close()
+    if data:
+        yield data
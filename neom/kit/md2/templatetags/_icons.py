@@ -27,23 +27,49 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+"""Material Icons font inlined as a data url.
+
+The font and the style built with it weigh about 171 KB, so they are only
+read on first access to ``content``.
+"""
+
+import functools
 import os.path
 
 from neom.templatetags.neom_webtools import keytoken as _kt
 
 base_dir = os.path.dirname(__file__)
 
-with open(os.path.join(base_dir, "_icons.raw")) as f:
-    _icons = f.read()
-
-content = (
-    "@font-face {font-family: 'Material Icons';font-style:"
-    " normal;font-weight: 400;src:"
-    f" url(data:application/font-woff2;charset=utf-8;base64,{_icons})"
-    f" format('woff2');}}.{_kt('material-icons')}{{font-family: 'Material"
-    " Icons';font-weight: normal;font-style: normal;font-size:"
-    " 24px;line-height: 1;letter-spacing: normal;text-transform: none;display:"
-    " inline-block;white-space: nowrap;word-wrap: normal;direction:"
-    " ltr;-webkit-font-feature-settings: 'liga';-webkit-font-smoothing:"
-    " antialiased;}"
-)
+
+@functools.cache
+def raw() -> str:
+    with open(os.path.join(base_dir, "_icons.raw")) as f:
+        return f.read()
+
+
+def style(src: str) -> str:
+    return (
+        "@font-face {font-family: 'Material Icons';font-style:"
+        f" normal;font-weight: 400;src: {src}"
+        f" format('woff2');}}.{_kt('material-icons')}{{font-family: 'Material"
+        " Icons';font-weight: normal;font-style: normal;font-size:"
+        " 24px;line-height: 1;letter-spacing: normal;text-transform:"
+        " none;display: inline-block;white-space: nowrap;word-wrap:"
+        " normal;direction: ltr;-webkit-font-feature-settings:"
+        " 'liga';-webkit-font-smoothing: antialiased;}"
+    )
+
+
+def data_url(raw: str) -> str:
+    return f"url(data:application/font-woff2;charset=utf-8;base64,{raw})"
+
+
+@functools.cache
+def _content() -> str:
+    return style(data_url(raw()))
+
+
+def __getattr__(name: str):
+    if name == "content":
+        return _content()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
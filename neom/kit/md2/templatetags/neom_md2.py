@@ -27,6 +27,12 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from django.template import TemplateSyntaxError
+from django.template.base import Parser, Token
+
+from neom.kit.md2 import assets
+from neom.kit.md2.fragments import FragmentCacheNode
+from neom.kit.template import needs
 from neom.kit.template.library import Library
 from neom.templatetags.neom_webtools import keytoken as _kt
 
@@ -36,6 +42,7 @@ __all__ = (
     "neom_md2_button_contained",
     "neom_md2_button_outlined",
     "neom_md2_button_text",
+    "neom_md2_cache",
     "neom_md2_card_actions",
     "neom_md2_card_action_button",
     "neom_md2_card_action_link",
@@ -43,6 +50,7 @@ __all__ = (
     "neom_md2_card_elevated",
     "neom_md2_card_outlined",
     "neom_md2_icons",
+    "neom_md2_scripts",
     "neom_md2_style",
     "neom_md2_style_script",
 )
@@ -54,52 +62,109 @@ register = Library()
 # head
 
 
-@register.directtag
+def _link_style():
+    return f'<link rel="stylesheet" href="{assets.url("web.css")}">'
+
+
+def _link_script():
+    return (
+        f'<script src="{assets.url("web.js")}"></script>'
+        f'<script src="{assets.url("boot.js")}"></script>'
+    )
+
+
+@register.singletag
 def neom_md2_style():
-    return '<style>{% include "neom/kit/md2/web.css" %}</style>'
+    """Stylesheet of md2 components.
+
+    With ``NEOM_MD2["STYLE"] = "critical"`` it leaves a marker replaced by
+    ``CriticalStyleMiddleware`` with the rules of the components rendered in
+    the response, while the full stylesheet loads asynchronously.
+    """
+    if assets.is_critical():
+        return assets.CRITICAL_MARKER
+    if assets.is_static():
+        return _link_style()
+    return f"<style>{assets.rendered('web.css')}</style>"
 
 
 @register.singletag
 def neom_md2_icons():
+    if assets.is_static() and assets.has(assets.ICONS):
+        src = assets.icons_src()
+        preload = (
+            ""
+            if src.startswith("url(data:")
+            else (
+                f'<link rel="preload" href="{assets.url(assets.ICONS)}"'
+                ' as="font" type="font/woff2" crossorigin>'
+            )
+        )
+        return f"{preload}<style>{_icons.style(src)}</style>"
     return f"<style>{_icons.content}</style>"
 
 
-@register.directtag
+@register.singletag
 def neom_md2_style_script():
+    if assets.is_static():
+        return _link_style() + _link_script()
     return (
-        '<style>{% include "neom/kit/md2/web.css" %}</style>'
-        '<script>{% include "neom/kit/md2/web.js" %}</script>'
+        f"<style>{assets.rendered('web.css')}</style>"
+        f"<script>{assets.rendered('web.js')}</script>"
+        f"<script>{assets.rendered('boot.js')}</script>"
+    )
+
+
+@register.singletag
+def neom_md2_scripts():
+    """Deferred script chunks for the components rendered so far.
+
+    Place it at the end of the body. Without built chunks it loads the whole
+    script, and in inline mode ``neom_md2_style_script`` is used instead.
+    The boot script comes last and attaches every ``data-neom-md2`` element.
+    """
+    if not assets.is_static():
+        return ""
+
+    return "".join(
+        f'<script defer src="{assets.url(name)}"></script>'
+        for name in assets.scripts(needs.collected())
     )
 
 
 # -----------------------------------------------------------------------------
 # buttons
 
+# Attached by the md2 boot script.
+_RIPPLE = 'data-neom-md2="ripple"'
 
-@register.singletag
+
+@register.cachedtag(needs=("button",), pure=True)
 def neom_md2_button_text(label: str):
     return (
-        f'<button class="{_kt("mdc-button")}">'
+        f'<button class="{_kt("mdc-button")}" {_RIPPLE}>'
         f'<span class="{_kt("mdc-button__ripple")}"></span>'
         f'<span class="{_kt("mdc-button__label")}">{label}</span>'
         "</button>"
     )
 
 
-@register.singletag
+@register.cachedtag(needs=("button",), pure=True)
 def neom_md2_button_outlined(label: str):
     return (
-        f'<button class="{_kt("mdc-button")} {_kt("mdc-button--outlined")}">'
+        f'<button class="{_kt("mdc-button")} {_kt("mdc-button--outlined")}"'
+        f" {_RIPPLE}>"
         f'<span class="{_kt("mdc-button__ripple")}"></span>'
         f'<span class="{_kt("mdc-button__label")}">{label}</span>'
         "</button>"
     )
 
 
-@register.singletag
+@register.cachedtag(needs=("button",), pure=True)
 def neom_md2_button_contained(label: str):
     return (
-        f'<button class="{_kt("mdc-button")} {_kt("mdc-button--raised")}">'
+        f'<button class="{_kt("mdc-button")} {_kt("mdc-button--raised")}"'
+        f" {_RIPPLE}>"
         f'<span class="{_kt("mdc-button__label")}">{label}</span>'
         "</button>"
     )
@@ -109,12 +174,12 @@ def neom_md2_button_contained(label: str):
 # cards
 
 
-@register.composetag
+@register.composetag(needs=("card",), pure=True)
 def neom_md2_card_elevated():
     return f'<div class="{_kt("mdc-card")}">', "</div>"
 
 
-@register.composetag
+@register.composetag(needs=("card",), pure=True)
 def neom_md2_card_outlined():
     return (
         f'<div class="{_kt("mdc-card")} {_kt("mdc-card--outlined")}">',
@@ -122,12 +187,12 @@ def neom_md2_card_outlined():
     )
 
 
-@register.composetag
+@register.composetag(needs=("card",), pure=True)
 def neom_md2_card_actions():
     return f'<div class="{_kt("mdc-card__actions")}">', "</div>"
 
 
-@register.composetag
+@register.composetag(needs=("card",), pure=True)
 def neom_md2_card_actions_full_bleed():
     return (
         "<div"
@@ -137,22 +202,47 @@ def neom_md2_card_actions_full_bleed():
     )
 
 
-@register.singletag
+@register.cachedtag(needs=("button", "card"), pure=True)
 def neom_md2_card_action_button(label: str):
     return (
         "<button"
         f' class="{_kt("mdc-button")} {_kt("mdc-card__action")} '
-        f'{_kt("mdc-card__action--button")}"><div'
+        f'{_kt("mdc-card__action--button")}" {_RIPPLE}><div'
         f' class="{_kt("mdc-button__ripple")}"></div><span'
         f' class="{_kt("mdc-button__label")}">{label}</span></button>'
     )
 
 
-@register.singletag
+@register.cachedtag(needs=("button", "card"), pure=True)
 def neom_md2_card_action_link(label: str, link: str):
     return (
         f'<a class="{_kt("mdc-button")} {_kt("mdc-card__action")} '
-        f'{_kt("mdc-card__action--button")}"'
+        f'{_kt("mdc-card__action--button")}" {_RIPPLE}'
         f' href="{link}"><div class="{_kt("mdc-button__ripple")}"></div><span'
         f' class="{_kt("mdc-button__label")}">{label}</span></a>'
     )
+
+
+# -----------------------------------------------------------------------------
+# cache
+
+
+@register.tag
+def neom_md2_cache(parser: Parser, token: Token):
+    """Cache the rendered body for ``timeout`` seconds.
+
+    ``{% neom_md2_cache key timeout [vary ...] %}...{% end %}``
+    """
+    bits = token.split_contents()
+    if len(bits) < 3:
+        raise TemplateSyntaxError(
+            f"{bits[0]} tag takes at least two arguments: the key and timeout"
+        )
+    nodelist = parser.parse(("end",))
+    parser.delete_first_token()
+    return FragmentCacheNode(
+        nodelist,
+        parser.compile_filter(bits[1]),
+        parser.compile_filter(bits[2]),
+        [parser.compile_filter(bit) for bit in bits[3:]],
+    )
@@ -0,0 +1,224 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Prune the md2 stylesheet to the classes actually used.
+
+The pruning runs on the ``web.css`` template source, where class names are
+still readable as ``{% _kt 'name' %}``. A selector is kept when every class
+it requires belongs to a used BEM block (``mdc-button`` for
+``mdc-button__label`` or ``mdc-button--raised``), so modifiers toggled from
+script stay available. Grouping at-rules are pruned recursively and
+keyframes are kept only when a remaining rule animates with them.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Iterable, List, Optional, Set, Tuple
+
+from django.template import engines
+
+from neom.kit.md2 import usage
+
+__all__ = ["KEEP", "prune", "used_icons", "used_names"]
+
+# Blocks only added from script by the md2 components.
+KEEP = ("mdc-ripple-upgraded", "mdc-ripple-surface")
+
+ASSETS_DIR = usage.NEOM_DIR / "templates" / "neom" / "kit" / "md2"
+
+_CLASS_RE = re.compile("\\.\x01([^\x02]*)\x02")
+_NOT_RE = re.compile(r":not\([^()]*\)")
+_BLOCK_RE = re.compile(r"__|--")
+_ANIMATION_RE = re.compile(r"animation(?:-name)?\s*:([^;}]*)")
+_IDENT_RE = re.compile("[-\\w\x01\x02]+")
+
+GROUPING = ("@media", "@supports", "@document", "@layer", "@container")
+KEYFRAMES = ("@keyframes", "@-webkit-keyframes")
+
+# (prelude, body, children) where children is None for opaque blocks.
+Block = Tuple[str, str, Optional[List["Block"]]]
+
+
+def block(name: str) -> str:
+    return _BLOCK_RE.split(name, 1)[0]
+
+
+def _dirs(paths: Iterable[Path]) -> List[Path]:
+    dirs = [usage.NEOM_DIR, *paths]
+    for engine in engines.all():
+        dirs.extend(Path(path) for path in engine.template_dirs)
+    return [path for path in dirs if path.exists()]
+
+
+def _assets() -> Set[Path]:
+    return {path.resolve() for path in ASSETS_DIR.glob("*.*")}
+
+
+def used_names(paths: Iterable[Path] = ()) -> Set[str]:
+    """Index ``_kt`` names used by neom tags, widgets and project templates.
+
+    The md2 asset templates are skipped, otherwise every class is used.
+    """
+    return usage.scan(_dirs(paths), _assets())
+
+
+def used_icons(paths: Iterable[Path] = ()) -> Set[str]:
+    """Index icon ligatures used by neom tags and project templates."""
+    return usage.scan_icons(_dirs(paths), _assets())
+
+
+def _parse(css: str, i: int, nested: bool) -> Tuple[List[Block], int]:
+    blocks: List[Block] = []
+    start = i
+    while i < len(css):
+        char = css[i]
+        if char in "\"'":
+            i = usage.skip_string(css, i)
+        elif char == ";" and css[start:i].lstrip().startswith("@"):
+            i += 1
+            blocks.append((css[start:i], "", None))
+            start = i
+        elif char == "{":
+            prelude = css[start:i]
+            if prelude.lstrip().startswith(GROUPING):
+                children, i = _parse(css, i + 1, True)
+                blocks.append((prelude, "", children))
+            else:
+                begin = end = i + 1
+                depth = 1
+                while depth:
+                    if css[end] in "\"'":
+                        end = usage.skip_string(css, end)
+                        continue
+                    depth += {"{": 1, "}": -1}.get(css[end], 0)
+                    end += 1
+                close = end - 1
+                blocks.append((prelude, css[begin:close], None))
+                i = end
+            start = i
+        elif char == "}" and nested:
+            return blocks, i + 1
+        else:
+            i += 1
+    return blocks, i
+
+
+def _split_selectors(prelude: str) -> List[str]:
+    selectors = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(prelude):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and not depth:
+            selectors.append(prelude[start:i])
+            start = i + 1
+    selectors.append(prelude[start:])
+    return selectors
+
+
+def _keep_selector(selector: str, blocks: Set[str]) -> bool:
+    required = _CLASS_RE.findall(_NOT_RE.sub("", selector))
+    return all(block(name) in blocks for name in required)
+
+
+def _shake(items: List[Block], blocks: Set[str]) -> List[Block]:
+    kept: List[Block] = []
+    for prelude, body, children in items:
+        if children is not None:
+            children = _shake(children, blocks)
+            if children:
+                kept.append((prelude, body, children))
+        elif prelude.lstrip().startswith("@"):
+            kept.append((prelude, body, None))
+        else:
+            selectors = [
+                selector
+                for selector in _split_selectors(prelude)
+                if _keep_selector(selector, blocks)
+            ]
+            if selectors:
+                kept.append((",".join(selectors), body, None))
+    return kept
+
+
+def _animations(items: List[Block]) -> Set[str]:
+    names: Set[str] = set()
+    for prelude, body, children in items:
+        if children is not None:
+            names |= _animations(children)
+        elif not prelude.lstrip().startswith(KEYFRAMES):
+            for value in _ANIMATION_RE.findall(body):
+                names.update(_IDENT_RE.findall(value))
+    return names
+
+
+def _drop_keyframes(items: List[Block], names: Set[str]) -> List[Block]:
+    kept: List[Block] = []
+    for prelude, body, children in items:
+        if children is not None:
+            children = _drop_keyframes(children, names)
+            if children:
+                kept.append((prelude, body, children))
+        elif prelude.lstrip().startswith(KEYFRAMES):
+            if prelude.split()[-1] in names:
+                kept.append((prelude, body, None))
+        else:
+            kept.append((prelude, body, None))
+    return kept
+
+
+def _serialize(items: List[Block]) -> str:
+    return "".join(
+        f"{prelude}{{{_serialize(children)}}}"
+        if children is not None
+        else prelude
+        if prelude.endswith(";")
+        else f"{prelude}{{{body}}}"
+        for prelude, body, children in items
+    )
+
+
+def prune(source: str, used: Iterable[str], keep: Iterable[str] = KEEP) -> str:
+    """Prune a stylesheet template source to the rules of used classes."""
+    blocks = {block(name) for name in (*used, *keep)}
+
+    header, css = usage.mark(source)
+
+    items, _ = _parse(css, 0, False)
+    items = _shake(items, blocks)
+    items = _drop_keyframes(items, _animations(items))
+
+    css = usage.unmark(_serialize(items))
+    trailing = len(source.rstrip())
+    return header + css + source[trailing:]
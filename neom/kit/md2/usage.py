@@ -0,0 +1,193 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Index of the class names passed to ``_kt`` by templates and tags.
+
+Only the places holding class names are read: ``_kt`` and ``keytoken``
+calls in Python code, ``class`` attributes of HTML templates, stylesheet
+selectors and script string constants. Docstrings, comments, URLs and CSS
+strings are skipped, so words that only look like names stay out.
+
+Besides class names, the Material Icons ligatures written as the text of
+``material-icons`` elements are indexed to subset the icons font.
+
+The asset transforms read the same tags: :func:`mark` swaps each literal
+``_kt`` tag of an asset template for a marked name, and :func:`unmark`
+writes the tags back.
+"""
+
+from __future__ import annotations
+
+import ast
+import re
+from pathlib import Path
+from typing import Collection, Iterable, Iterator, Set, Tuple
+
+__all__ = [
+    "NEOM_DIR",
+    "mark",
+    "scan",
+    "scan_icons",
+    "scan_python",
+    "scan_source_icons",
+    "scan_template",
+    "skip_string",
+    "unmark",
+]
+
+NEOM_DIR = Path(__file__).resolve().parent.parent.parent
+
+TEMPLATE_SUFFIXES = (".html", ".css", ".js", ".txt")
+
+KEYTOKEN_CALLS = frozenset(("_kt", "keytoken"))
+
+# Leading comments and ``load`` tags of an asset template.
+_HEADER_RE = re.compile(r"(?:\s*(?:{#.*?#}|{%\s*load\b.*?%}))*\s*")
+_KT_RE = re.compile(r"""{%\s*_kt\s+'([^']+)'\s*%}""")
+_MARK_RE = re.compile("\x01([^\x02]*)\x02")
+_TEMPLATE_RE = re.compile(r"""{%\s*_kt\s+(['"])([^'"]+)\1\s*%}""")
+_CLASS_RE = re.compile(r'\bclass\s*=\s*"([^"]*)"')
+# Comments, ``url()`` values and double-quoted strings of a stylesheet. The
+# tags themselves quote with single quotes.
+_CSS_SKIP_RE = re.compile(
+    r"/\*.*?\*/" r"""|\burl\(\s*(?:"[^"]*"|'[^']*'|[^)]*)\)""" r'|"[^"]*"',
+    re.DOTALL,
+)
+_ICON_RE = re.compile(
+    r"""material-icons['"]\s*(?:%}|\)})[^"]*"[^>]*>\s*([a-z0-9_]+)\s*<"""
+)
+
+
+def _tags(source: str) -> Set[str]:
+    return {match[1] for match in _TEMPLATE_RE.findall(source)}
+
+
+def scan_template(source: str, suffix: str = ".html") -> Set[str]:
+    """Collect literal ``{% _kt 'name' %}`` arguments holding class names.
+
+    Markup is read in ``class`` attributes, stylesheets out of comments,
+    URLs and strings, and scripts in full since their names are constants.
+    """
+    if suffix == ".css":
+        return _tags(_CSS_SKIP_RE.sub(" ", source))
+    if suffix == ".js":
+        return _tags(source)
+    return set().union(*map(_tags, _CLASS_RE.findall(source)))
+
+
+def _call_name(node: ast.expr) -> str:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return ""
+
+
+def scan_python(source: str) -> Set[str]:
+    """Collect literal ``_kt("name")`` and ``keytoken("name")`` arguments."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return set()
+
+    return {
+        node.args[0].value
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call)
+        and _call_name(node.func) in KEYTOKEN_CALLS
+        and len(node.args) == 1
+        and isinstance(node.args[0], ast.Constant)
+        and isinstance(node.args[0].value, str)
+    }
+
+
+def scan_source_icons(source: str) -> Set[str]:
+    """Collect the ligature names of ``material-icons`` elements."""
+    return set(_ICON_RE.findall(source))
+
+
+def _files(paths: Iterable[Path], exclude: Collection[Path]) -> Iterator[Path]:
+    for path in paths:
+        files = sorted(path.rglob("*")) if path.is_dir() else (path,)
+        for file in files:
+            if not (exclude and file.resolve() in exclude):
+                yield file
+
+
+def scan(
+    paths: Iterable[Path] = (NEOM_DIR,), exclude: Collection[Path] = ()
+) -> Set[str]:
+    """Scan files and directories recursively for keytoken names."""
+    names: Set[str] = set()
+    for file in _files(paths, exclude):
+        if file.suffix == ".py":
+            names |= scan_python(file.read_text())
+        elif file.suffix in TEMPLATE_SUFFIXES:
+            names |= scan_template(file.read_text(), file.suffix)
+    return names
+
+
+def scan_icons(
+    paths: Iterable[Path] = (NEOM_DIR,), exclude: Collection[Path] = ()
+) -> Set[str]:
+    """Scan files and directories recursively for icon ligature names."""
+    names: Set[str] = set()
+    for file in _files(paths, exclude):
+        if file.suffix == ".py" or file.suffix in TEMPLATE_SUFFIXES:
+            names |= scan_source_icons(file.read_text())
+    return names
+
+
+def mark(source: str) -> Tuple[str, str]:
+    """Split an asset template source into its header and marked body.
+
+    The body has each ``{% _kt 'name' %}`` replaced by ``\\x01name\\x02``.
+    """
+    match = _HEADER_RE.match(source)
+    if match is None:
+        raise ValueError("asset template header is not readable")
+    header = match[0]
+    body = _KT_RE.sub(
+        lambda tag: f"\x01{tag[1]}\x02", source.removeprefix(header)
+    )
+    return header, body
+
+
+def unmark(text: str) -> str:
+    """Write the marked names of ``text`` back as ``_kt`` tags."""
+    return _MARK_RE.sub(r"{% _kt '\1' %}", text)
+
+
+def skip_string(text: str, i: int) -> int:
+    """Index past the quoted string starting at ``i``."""
+    quote = text[i]
+    i += 1
+    while text[i] != quote:
+        i += 2 if text[i] == "\\" else 1
+    return i + 1
@@ -0,0 +1,123 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Serve the built md2 assets without a CDN.
+
+The variant is picked from ``Accept-Encoding`` among the ones written at
+build time. Files are named by content, so they are cached forever and
+revalidated with strong ETags.
+"""
+
+import mimetypes
+import posixpath
+from typing import Dict, List
+
+from django.http import FileResponse, Http404, HttpRequest, HttpResponse
+from django.views.decorators.http import require_safe
+
+from neom.kit.md2 import assets
+
+__all__ = ["serve"]
+
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def accepted_encodings(header: str) -> List[str]:
+    """Encodings of an ``Accept-Encoding`` header with a non zero quality."""
+    accepted = []
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding and quality > 0:
+            accepted.append(coding.strip().lower())
+    return accepted
+
+
+def etag(entry: Dict, encoding: str = "") -> str:
+    digest = entry["sha256"][:32]
+    return f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+
+
+def _not_modified(request: HttpRequest, entry: Dict) -> bool:
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    known = {etag(entry, encoding) for encoding in entry["encodings"]}
+    known.add(etag(entry))
+    return not tags.isdisjoint(known)
+
+
+def _select(request: HttpRequest, entry: Dict):
+    accepted = accepted_encodings(request.headers.get("Accept-Encoding", ""))
+    for encoding in assets.ENCODINGS:
+        if encoding in entry["encodings"] and (
+            encoding in accepted or "*" in accepted
+        ):
+            return encoding, entry["encodings"][encoding]
+    return "", entry
+
+
+def _headers(response: HttpResponse, entry: Dict, encoding: str):
+    response["ETag"] = etag(entry, encoding)
+    response["Cache-Control"] = CACHE_CONTROL
+    response["Vary"] = "Accept-Encoding"
+    return response
+
+
+@require_safe
+def serve(request: HttpRequest, path: str) -> HttpResponse:
+    entry = assets.entries_by_path().get(posixpath.normpath(path))
+    if entry is None:
+        raise Http404(f"Unknown md2 asset: {path}")
+
+    encoding, variant = _select(request, entry)
+
+    if _not_modified(request, entry):
+        return _headers(HttpResponse(status=304), entry, encoding)
+
+    content_type, _ = mimetypes.guess_type(entry["path"])
+    response = FileResponse(
+        assets.build_storage().open(variant["path"]),
+        content_type=content_type or "application/octet-stream",
+        filename=posixpath.basename(entry["path"]),
+    )
+    if encoding:
+        response["Content-Encoding"] = encoding
+    return _headers(response, entry, encoding)
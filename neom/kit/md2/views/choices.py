@@ -0,0 +1,71 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponseBadRequest,
+    JsonResponse,
+)
+from django.views.decorators.http import require_safe
+
+from neom.kit.md2 import choices as md2_choices
+
+__all__ = ["choices"]
+
+
+@require_safe
+def choices(request: HttpRequest, name: str):
+    """Page of options of a lazy md2 select source as JSON."""
+    try:
+        source = md2_choices.get(name)
+    except KeyError:
+        raise Http404(f"Unknown choice source: {name}")
+    if not source.allowed(request):
+        raise PermissionDenied
+
+    after = request.GET.get("after")
+    try:
+        limit = int(request.GET.get("limit", 0)) or None
+        if after is not None:
+            after = source.queryset.model._meta.pk.to_python(after)
+    except (ValueError, ValidationError):
+        return HttpResponseBadRequest()
+
+    options, after = source.page(request.GET.get("q", ""), after, limit)
+    return JsonResponse(
+        {
+            "results": [
+                {"value": str(value), "label": label}
+                for value, label in options
+            ],
+            "after": None if after is None else str(after),
+        }
+    )
@@ -0,0 +1,74 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from django.http import StreamingHttpResponse
+from django.template.backends.django import Template as BackendTemplate
+from django.template.loader import select_template
+from django.views.generic import base as base_views
+
+from neom.kit.md2 import assets
+from neom.kit.template import streaming
+
+__all__ = ["StreamingTemplateResponseMixin"]
+
+
+def _style() -> str:
+    """Markup replacing the critical style marker of a streamed head."""
+    if assets.is_critical():
+        return f'<link rel="stylesheet" href="{assets.url("web.css")}">'
+    return f"<style>{assets.rendered('web.css')}</style>"
+
+
+def _stream(template, context, request):
+    pending = True
+    for chunk in streaming.stream(template, context, request):
+        if pending and assets.CRITICAL_MARKER in chunk:
+            chunk = chunk.replace(assets.CRITICAL_MARKER, _style(), 1)
+            pending = False
+        yield chunk
+
+
+class StreamingTemplateResponseMixin(base_views.TemplateResponseMixin):
+    """Stream the response, flushing the md2 head before the blocks render.
+
+    The head goes out before the body knows its components, so a critical
+    style marker becomes a link to the full stylesheet.
+    """
+
+    def render_to_response(self, context, **response_kwargs):
+        template = select_template(
+            self.get_template_names(), using=self.template_engine
+        )
+        if not isinstance(template, BackendTemplate):
+            return super().render_to_response(context, **response_kwargs)
+
+        response_kwargs.setdefault("content_type", self.content_type)
+        return StreamingHttpResponse(
+            _stream(template, context, self.request), **response_kwargs
+        )
@@ -27,16 +27,63 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import functools
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
+
 import django.views.generic.edit as edit_views
-from django.core.exceptions import ImproperlyConfigured
-from django.db.models import fields as model_fields
+from django.contrib import messages
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.core.paginator import Paginator
+from django.db import router, transaction
+from django.db.models import Model, QuerySet
 from django.forms import models as model_forms
+from django.utils.autoreload import file_changed
 
 from neom.kit.md2.forms import fields as md2_fields
 from neom.kit.md2.forms import models as md2_model_forms
-from neom.kit.md2.forms import widgets as md2_widgets
 
-__all__ = ["UpdateView"]
+__all__ = ["BulkUpdateView", "UpdateView"]
+
+
+@functools.lru_cache(maxsize=256)
+def modelform(
+    model: Type[Model],
+    fields: Union[str, Tuple[str, ...]],
+    formfield_callback: Callable,
+) -> Type[md2_model_forms.ModelForm]:
+    """md2 model form class, built once per arguments."""
+    return model_forms.modelform_factory(
+        model,
+        md2_model_forms.ModelForm,
+        fields=fields,
+        formfield_callback=formfield_callback,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def modelformset(
+    model: Type[Model],
+    fields: Union[str, Tuple[str, ...]],
+    formfield_callback: Callable,
+) -> Type[md2_model_forms.BaseModelFormSet]:
+    """md2 model formset class editing existing objects only."""
+    return model_forms.modelformset_factory(
+        model,
+        md2_model_forms.ModelForm,
+        formset=md2_model_forms.BaseModelFormSet,
+        fields=fields,
+        formfield_callback=formfield_callback,
+        extra=0,
+    )
+
+
+def _source_changed(sender, file_path, **kwargs):
+    """Drop form classes built from models the autoreloader may reload."""
+    modelform.cache_clear()
+    modelformset.cache_clear()
+
+
+file_changed.connect(_source_changed, dispatch_uid="neom_md2_modelform")
 
 
 class UpdateView(edit_views.UpdateView):
@@ -60,21 +107,132 @@ class UpdateView(edit_views.UpdateView):
                 else self.get_queryset().model
             )
 
-            return model_forms.modelform_factory(
-                model,
-                md2_model_forms.ModelForm,
-                fields=self.fields,
-                formfield_callback=self._formfield_callback,
+            fields = (
+                self.fields
+                if isinstance(self.fields, str)
+                else tuple(self.fields)
             )
 
-    @staticmethod
-    def _formfield_callback(field, **kwargs):
-        if isinstance(field, model_fields.CharField):
-            return md2_fields.TextField(**kwargs, widget=md2_widgets.TextInput)
+            return modelform(model, fields, self._formfield_callback)
+
+    _formfield_callback = staticmethod(md2_fields.formfield)
+
+
+class BulkUpdateView(edit_views.FormView):
+    """Edit many objects at once with an md2 model formset.
+
+    The objects are fetched in one query. Once every form is valid, the
+    changed objects are written with ``bulk_update`` in batches of
+    ``batch_size`` inside one transaction, grouped by the fields that
+    changed. ``save()`` and model signals are not called, and many-to-many
+    fields are not saved. ``updated`` holds the number of rows written.
+
+    One page of ``paginate_by`` objects, in primary key order, is edited
+    per request, chosen by the ``page_kwarg`` query parameter and kept as
+    ``page_obj`` in the context. Each form costs its own unique checks on
+    submit, so keep the page small rather than editing a whole table.
+    """
+
+    model: Optional[Type[Model]] = None
+    queryset: Optional[QuerySet] = None
+    fields: Union[str, Sequence[str], None] = None
+    batch_size = 500
+    paginate_by = 100
+    page_kwarg = "page"
+    success_message = "%(updated)d rows updated."
+    template_name_suffix = "_bulk_form"
 
-        if isinstance(field, model_fields.IntegerField) and field.choices:
-            return md2_fields.SelectField(
-                choices=field.choices, **kwargs, widget=md2_widgets.Select
+    updated = 0
+
+    def get_queryset(self) -> QuerySet:
+        if self.queryset is not None:
+            return self.queryset.all()
+        if self.model is not None:
+            return self.model._default_manager.all()
+        raise ImproperlyConfigured(
+            f"{self.__class__.__name__} is missing a QuerySet. Define"
+            f" {self.__class__.__name__}.model or"
+            f" {self.__class__.__name__}.queryset."
+        )
+
+    def get_template_names(self):
+        if self.template_name is not None:
+            return [self.template_name]
+        opts = self.get_queryset().model._meta
+        return [
+            f"{opts.app_label}/{opts.model_name}{self.template_name_suffix}"
+            ".html"
+        ]
+
+    def get_form_class(self):
+        if self.form_class:
+            return self.form_class
+
+        if self.fields is None:
+            raise ImproperlyConfigured(
+                "Using without the 'fields' attribute is prohibited."
+            )
+
+        fields = (
+            self.fields if isinstance(self.fields, str) else tuple(self.fields)
+        )
+        return modelformset(
+            self.get_queryset().model, fields, self._formfield_callback
+        )
+
+    _formfield_callback = staticmethod(md2_fields.formfield)
+
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        kwargs.pop("initial")
+        paginator = Paginator(
+            self.get_queryset().order_by("pk"), self.paginate_by
+        )
+        self.page_obj = paginator.get_page(
+            self.request.GET.get(self.page_kwarg)
+        )
+        kwargs["queryset"] = self.page_obj.object_list
+        return kwargs
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["page_obj"] = self.page_obj
+        return context
+
+    def form_valid(self, form):
+        self.updated = self.save(form)
+        messages.success(
+            self.request,
+            self.success_message % {"updated": self.updated},
+            fail_silently=True,
+        )
+        return super().form_valid(form)
+
+    def save(self, formset: model_forms.BaseModelFormSet) -> int:
+        """Write the changed fields of the edited objects."""
+        model = formset.model
+        groups: Dict[Tuple[str, ...], List[Model]] = {}
+        for form in formset.initial_forms:
+            fields = tuple(
+                name
+                for name in form.changed_data
+                if self._updatable(model, name)
             )
+            if fields:
+                groups.setdefault(fields, []).append(form.instance)
 
-        return field.formfield(**kwargs)
+        manager = model._default_manager
+        with transaction.atomic(using=router.db_for_write(model)):
+            for fields, objs in groups.items():
+                manager.bulk_update(objs, fields, batch_size=self.batch_size)
+        return sum(len(objs) for objs in groups.values())
+
+    @staticmethod
+    def _updatable(model: Type[Model], name: str) -> bool:
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return False
+        return (
+            field.concrete and not field.many_to_many and not field.primary_key
+        )
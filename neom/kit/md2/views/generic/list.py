@@ -0,0 +1,347 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""md2 list view paginated by keyset.
+
+Pages continue from the sort key of the last row shown, carried in a
+signed cursor, so the database seeks through an index instead of counting
+past an offset and any page costs the same as the first one.
+"""
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+import django.views.generic.list as list_views
+from django.core import signing
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ImproperlyConfigured,
+    ValidationError,
+)
+from django.db.models import (
+    DecimalField,
+    Field,
+    FloatField,
+    IntegerField,
+    Model,
+    Q,
+    QuerySet,
+)
+from django.http import Http404
+
+from neom.kit.template import needs
+from neom.templatetags.neom_webtools import keytoken as _kt
+
+__all__ = ["KeysetPage", "ListView"]
+
+CURSOR_SALT = "neom.kit.md2.list"
+
+Key = Tuple[str, str]
+
+
+def _indexed(model: Model, name: str) -> bool:
+    if name == "pk":
+        return True
+    field = model._meta.get_field(name)
+    return bool(
+        field.primary_key
+        or field.unique
+        or field.db_index
+        or any(
+            index.fields and index.fields[0] == name
+            for index in model._meta.indexes
+        )
+    )
+
+
+class KeysetPage:
+    """Rows of a page and the cursors around it."""
+
+    def __init__(
+        self,
+        object_list: List[Model],
+        next_cursor: Optional[str],
+        previous_cursor: Optional[str],
+    ):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+
+class Column:
+    """Header and cell markup of a table column, computed once."""
+
+    def __init__(
+        self, model: Model, name: str, sort: str, sort_url: Optional[str]
+    ):
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            field = None
+
+        self.name = name
+        self.label = (
+            field.verbose_name if field is not None else name.replace("_", " ")
+        )
+        self.display = (
+            f"get_{name}_display" if field and field.choices else name
+        )
+        self.sort_url = sort_url
+        self.aria_sort = None
+
+        header = [_kt("mdc-data-table__header-cell")]
+        cell = [_kt("mdc-data-table__cell")]
+        if isinstance(field, (IntegerField, DecimalField, FloatField)):
+            header.append(_kt("mdc-data-table__header-cell--numeric"))
+            cell.append(_kt("mdc-data-table__cell--numeric"))
+        if sort_url is not None:
+            header.append(_kt("mdc-data-table__header-cell--with-sort"))
+        if sort.lstrip("-") == name:
+            header.append(_kt("mdc-data-table__header-cell--sorted"))
+            self.aria_sort = "ascending"
+            if sort.startswith("-"):
+                header.append(
+                    _kt("mdc-data-table__header-cell--sorted-descending")
+                )
+                self.aria_sort = "descending"
+
+        self.header_class = " ".join(header)
+        self.cell_class = " ".join(cell)
+
+    def value(self, obj: Model) -> Any:
+        value = getattr(obj, self.display)
+        return value() if self.display != self.name else value
+
+
+class Table:
+    """md2 data table of a page of rows."""
+
+    next_url: Optional[str] = None
+    previous_url: Optional[str] = None
+
+    def __init__(self, columns: List[Column], rows: Sequence[Model]):
+        needs.add("datatable", "button")
+        self.row_class = _kt("mdc-data-table__row")
+        self.columns = columns
+        self.rows = [
+            [(column.value(obj), column.cell_class) for column in columns]
+            for obj in rows
+        ]
+
+
+class ListView(list_views.ListView):
+    """List ``columns`` of the queryset as an md2 data table.
+
+    ``sortable`` names the columns users may sort by. Each, like
+    ``ordering``, must be backed by a database index and not nullable,
+    which ``as_view`` checks once for the model it is given. The rows are
+    ordered by that column then by primary key, and the cursor in
+    ``cursor_kwarg`` carries both values of the last (or first) row. With
+    ``only`` set and every column a concrete field, only those columns are
+    fetched.
+    """
+
+    columns: Tuple[str, ...] = ()
+    sortable: Tuple[str, ...] = ()
+    ordering = "pk"
+    only = True
+    paginate_by = 25
+    cursor_kwarg = "cursor"
+    sort_kwarg = "sort"
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        model = initkwargs.get("model", cls.model)
+        queryset = initkwargs.get("queryset", cls.queryset)
+        if model is None and queryset is not None:
+            model = queryset.model
+        if model is not None:
+            ordering = initkwargs.get("ordering", cls.ordering)
+            sortable = initkwargs.get("sortable", cls.sortable)
+            for name in (ordering.lstrip("-"), *sortable):
+                if not _indexed(model, name):
+                    raise ImproperlyConfigured(
+                        f"{cls.__name__} sorts by {name!r}, which has no index."
+                    )
+                if name != "pk" and model._meta.get_field(name).null:
+                    raise ImproperlyConfigured(
+                        f"{cls.__name__} sorts by {name!r}, which is nullable."
+                    )
+        return view
+
+    def get_template_names(self):
+        return [*super().get_template_names(), "neom/kit/md2/datatable.html"]
+
+    def get_queryset(self) -> QuerySet:
+        queryset = super().get_queryset()
+        if self.only and self.columns:
+            opts = queryset.model._meta
+            try:
+                fields = [opts.get_field(name) for name in self.columns]
+            except FieldDoesNotExist:
+                return queryset
+            if all(field.concrete for field in fields):
+                name, _ = self.get_sort()
+                queryset = queryset.only(
+                    *{field.attname for field in fields}, name
+                )
+        return queryset
+
+    def get_sort(self) -> Tuple[str, bool]:
+        """Sorted column name and whether it descends."""
+        sort = self.request.GET.get(self.sort_kwarg) or self.ordering
+        name = sort.lstrip("-")
+        if name not in ("pk", *self.sortable):
+            sort = self.ordering
+            name = sort.lstrip("-")
+        return name, sort.startswith("-")
+
+    def get_sort_field(self, model: Model, name: str) -> Field:
+        if name == "pk":
+            return model._meta.pk
+        return model._meta.get_field(name)
+
+    def paginate_queryset(self, queryset: QuerySet, page_size: int):
+        model = queryset.model
+        name, descending = self.get_sort()
+        field = self.get_sort_field(model, name)
+        sort = f"-{name}" if descending else name
+
+        after, backwards = None, False
+        token = self.request.GET.get(self.cursor_kwarg)
+        if token:
+            try:
+                key, cursor_sort, backwards = signing.loads(
+                    token, salt=CURSOR_SALT
+                )
+                if cursor_sort == sort:
+                    after = (
+                        field.to_python(key[0]),
+                        model._meta.pk.to_python(key[1]),
+                    )
+                else:
+                    backwards = False
+            except (signing.BadSignature, ValidationError, ValueError) as error:
+                raise Http404("Invalid cursor") from error
+
+        sign = "-" if descending != backwards else ""
+        order = (
+            [f"{sign}{name}"]
+            if name == "pk"
+            else [f"{sign}{name}", f"{sign}pk"]
+        )
+        if after is not None:
+            lookup = "lt" if sign else "gt"
+            if name == "pk":
+                condition = Q(**{f"pk__{lookup}": after[1]})
+            else:
+                condition = Q(**{f"{name}__{lookup}": after[0]}) | Q(
+                    **{name: after[0], f"pk__{lookup}": after[1]}
+                )
+            queryset = queryset.filter(condition)
+
+        objs = list(queryset.order_by(*order)[: page_size + 1])
+        more = len(objs) > page_size
+        objs = objs[:page_size]
+        if backwards:
+            objs.reverse()
+
+        has_next = more if not backwards else after is not None
+        has_previous = after is not None if not backwards else more
+
+        def cursor(obj: Model, backwards: bool) -> str:
+            key: Key = (field.value_to_string(obj), str(obj.pk))
+            return signing.dumps(
+                (key, sort, backwards), salt=CURSOR_SALT, compress=True
+            )
+
+        page = KeysetPage(
+            objs,
+            cursor(objs[-1], False) if objs and has_next else None,
+            cursor(objs[0], True) if objs and has_previous else None,
+        )
+        return None, page, objs, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        model = self.object_list.model
+        name, descending = self.get_sort()
+        sort = f"-{name}" if descending else name
+
+        query = self.request.GET.copy()
+        query.pop(self.cursor_kwarg, None)
+
+        def url(key: str, value: str) -> str:
+            params = query.copy()
+            params[key] = value
+            return f"?{params.urlencode()}"
+
+        columns = [
+            Column(
+                model,
+                column,
+                sort,
+                (
+                    url(
+                        self.sort_kwarg,
+                        column if sort != column else f"-{column}",
+                    )
+                    if column in self.sortable
+                    else None
+                ),
+            )
+            for column in self.columns
+        ]
+        table = Table(columns, context["object_list"])
+
+        page = context["page_obj"]
+        if page is not None:
+            if page.next_cursor is not None:
+                table.next_url = url(self.cursor_kwarg, page.next_cursor)
+            if page.previous_cursor is not None:
+                table.previous_url = url(
+                    self.cursor_kwarg, page.previous_cursor
+                )
+        context["table"] = table
+        return context
@@ -29,22 +29,233 @@
 
 from __future__ import annotations
 
-from typing import Callable, Tuple
+import functools
+import itertools
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple, cast
 
+from django.template.base import (
+    Node,
+    NodeList,
+    Parser,
+    Token,
+    Variable,
+    kwarg_re,
+)
 from nomos.template.library import Library as LibraryBase
 from typing_extensions import ParamSpec  # TODO: 3.10
 
+from neom.kit.template import needs as template_needs
+
 __all__ = ["Library"]
 
 P = ParamSpec("P")
 
 
+def _needing(call: Callable, needs: Tuple[str, ...]) -> Callable:
+    """Wrap ``call`` to add ``needs`` to the rendered components."""
+    if not needs:
+        return call
+
+    @functools.wraps(call)
+    def wrapper(*args, **kwargs):
+        template_needs.add(*needs)
+        return call(*args, **kwargs)
+
+    return wrapper
+
+
+CACHEABLE = (str, int, float, bool, type(None))
+
+
+class Memoized(Protocol):
+    """Tag function with the cache controls of its LRU."""
+
+    cache_info: Callable[[], Any]
+    cache_clear: Callable[[], None]
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        ...
+
+
+def _memoized(call: Callable, maxsize: int) -> Memoized:
+    """Wrap ``call`` in an LRU for calls with plain immutable arguments.
+
+    Keys are typed, so a ``SafeString`` argument never shares an entry with
+    an equal ``str``.
+    """
+    cached = functools.lru_cache(maxsize=maxsize, typed=True)(call)
+
+    @functools.wraps(call)
+    def wrapper(*args, **kwargs):
+        values = itertools.chain(args, kwargs.values())
+        if all(isinstance(value, CACHEABLE) for value in values):
+            return cached(*args, **kwargs)
+        return call(*args, **kwargs)
+
+    memoized = cast(Memoized, wrapper)
+    memoized.cache_info = cached.cache_info
+    memoized.cache_clear = cached.cache_clear
+    return memoized
+
+
+def _literals(parser: Parser, bits: List[str]) -> Optional[List[Any]]:
+    """Values of ``bits`` if all are plain literals, else ``None``."""
+    args = []
+    for bit in bits:
+        if bit.startswith("_(") or kwarg_re.match(bit).group(1):
+            return None
+        expression = parser.compile_filter(bit)
+        if expression.filters:
+            return None
+        value = expression.var
+        if isinstance(value, Variable):
+            if value.literal is None:
+                return None
+            value = value.literal
+        args.append(value)
+    return args
+
+
+class FoldedNode(Node):
+    """Output of a pure tag, computed when the template compiles."""
+
+    child_nodelists = ("nodelist",)
+
+    def __init__(
+        self,
+        text: str,
+        needs: Tuple[str, ...],
+        nodelist: Optional[NodeList] = None,
+        close: str = "",
+    ):
+        self.text = text
+        self.needs = needs
+        self.nodelist = nodelist
+        self.close = close
+
+    def render(self, context) -> str:
+        template_needs.add(*self.needs)
+        if self.nodelist is None:
+            return self.text
+        return f"{self.text}{self.nodelist.render(context)}{self.close}"
+
+
 class Library(LibraryBase):
-    def singletag(self, call: Callable[P, str]):
-        return self.inlinetag(call)
+    """Tag library of neom kits.
+
+    Each decorator takes an optional ``needs`` tuple of component names,
+    added to :mod:`neom.kit.template.needs` whenever the tag renders.
+
+    Single and compose tags marked ``pure`` only depend on their arguments.
+    Calls with literal arguments run once, when the template compiles.
+
+    ``calls`` maps each tag name to its kind (``"single"``, ``"compose"`` or
+    ``"direct"``) and the function that renders it, for other engines.
+    ``pure`` maps the pure ones to their bare function and needs, so those
+    engines can fold literal calls too.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls: Dict[str, Tuple[str, Callable]] = {}
+        self.pure: Dict[str, Tuple[Callable, Tuple[str, ...]]] = {}
+
+    def cachedtag(
+        self,
+        call: Optional[Callable[P, str]] = None,
+        *,
+        needs: Tuple[str, ...] = (),
+        pure: bool = False,
+        maxsize: int = 128,
+    ):
+        """Single tag memoizing its output per argument tuple.
+
+        The returned function exposes ``cache_info`` and ``cache_clear``.
+        """
+        if call is None:
+            return functools.partial(
+                self.cachedtag, needs=needs, pure=pure, maxsize=maxsize
+            )
+        memoized = _memoized(call, maxsize)
+        self.inlinetag(self._record("single", memoized, needs))
+        if pure:
+            self._fold(call, needs)
+        return memoized
+
+    def singletag(
+        self,
+        call: Optional[Callable[P, str]] = None,
+        *,
+        needs: Tuple[str, ...] = (),
+        pure: bool = False,
+    ):
+        if call is None:
+            return functools.partial(self.singletag, needs=needs, pure=pure)
+        tag = self.inlinetag(self._record("single", call, needs))
+        if pure:
+            self._fold(call, needs)
+        return tag
+
+    def composetag(
+        self,
+        call: Optional[Callable[P, Tuple[str, str]]] = None,
+        *,
+        needs: Tuple[str, ...] = (),
+        pure: bool = False,
+    ):
+        if call is None:
+            return functools.partial(self.composetag, needs=needs, pure=pure)
+        tag = self.bigentag(self._record("compose", call, needs))
+        if pure:
+            self._fold(call, needs, compose=True)
+        return tag
+
+    def directtag(
+        self,
+        call: Optional[Callable[P, str]] = None,
+        *,
+        needs: Tuple[str, ...] = (),
+    ):
+        if call is None:
+            return functools.partial(self.directtag, needs=needs)
+        return self.relinetag(self._record("direct", call, needs))
+
+    def _record(
+        self, kind: str, call: Callable, needs: Tuple[str, ...]
+    ) -> Callable:
+        wrapped = _needing(call, needs)
+        self.calls[call.__name__] = (kind, wrapped)
+        return wrapped
+
+    def _fold(
+        self, call: Callable, needs: Tuple[str, ...], compose: bool = False
+    ):
+        """Make the compile function of ``call`` fold literal calls."""
+        self.pure[call.__name__] = (call, needs)
+        compile_function = self.tags[call.__name__]
+
+        @functools.wraps(compile_function)
+        def compile(parser: Parser, token: Token) -> Node:
+            args = _literals(parser, token.split_contents()[1:])
+            if args is None:
+                return compile_function(parser, token)
+            try:
+                output = call(*args)
+            except TypeError:
+                return compile_function(parser, token)
+            if not compose:
+                return FoldedNode(output, needs)
 
-    def composetag(self, call: Callable[P, Tuple[str, str]]):
-        return self.bigentag(call)
+            node = compile_function(parser, token)
+            nodelists = [
+                nodelist
+                for nodelist in (
+                    getattr(node, name, None) for name in node.child_nodelists
+                )
+                if isinstance(nodelist, NodeList)
+            ]
+            if len(nodelists) != 1:
+                return node
+            return FoldedNode(output[0], needs, nodelists[0], output[1])
 
-    def directtag(self, call: Callable[P, str]):
-        return self.relinetag(call)
+        self.tags[call.__name__] = compile
@@ -0,0 +1,139 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Template loader keeping constant templates rendered on disk.
+
+A constant template only holds text and ``_kt`` calls on literals, like
+the md2 stylesheet and script. The first worker to compile one writes its
+output to the cache directory, keyed by the source, the Django version and
+the keytoken manifest version. Later workers load that text instead of
+parsing thousands of nodes. Other templates compile as usual. Templates
+are also cached in memory, as with Django's cached loader::
+
+    "loaders": [
+        (
+            "neom.kit.template.loaders.Loader",
+            [
+                "django.template.loaders.filesystem.Loader",
+                "django.template.loaders.app_directories.Loader",
+            ],
+            "/var/cache/neom/templates",
+        )
+    ]
+"""
+
+import contextlib
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Union
+
+import django
+from django.template import Context, Origin, Template, TemplateDoesNotExist
+from django.template.base import Node, NodeList, TextNode
+from django.template.defaulttags import CommentNode, LoadNode
+from django.template.library import SimpleNode
+from django.template.loaders import base, cached
+
+from neom.templatetags import neom_webtools
+
+__all__ = ["Loader", "is_constant"]
+
+
+def is_constant(node: Node) -> bool:
+    """Whether ``node`` renders the same text in any context."""
+    if isinstance(node, (TextNode, LoadNode, CommentNode)):
+        return True
+    return (
+        isinstance(node, SimpleNode)
+        and node.func is neom_webtools._kt
+        and not node.kwargs
+        and not node.target_var
+        and all(
+            isinstance(arg.var, str) and not arg.filters for arg in node.args
+        )
+    )
+
+
+class PrecompiledTemplate(Template):
+    """Template restored from its rendered text."""
+
+    def __init__(self, text: str, *args, **kwargs):
+        self.text = text
+        super().__init__(*args, **kwargs)
+
+    def compile_nodelist(self) -> NodeList:
+        return NodeList([TextNode(self.text)])
+
+
+class _PrecompiledLoader(base.Loader):
+    cache_dir: Path
+
+    def get_template(self, template_name, skip=None):
+        tried = []
+
+        for origin in self.get_template_sources(template_name):
+            if skip is not None and origin in skip:
+                tried.append((origin, "Skipped to avoid recursion"))
+                continue
+
+            try:
+                contents = self.get_contents(origin)
+            except TemplateDoesNotExist:
+                tried.append((origin, "Source does not exist"))
+                continue
+            else:
+                return self.compile(contents, origin)
+
+        raise TemplateDoesNotExist(template_name, tried=tried)
+
+    def compile(self, contents: str, origin: Origin) -> Template:
+        key = "\0".join((django.get_version(), neom_webtools.VERSION, contents))
+        path = self.cache_dir / hashlib.sha256(key.encode()).hexdigest()
+        args = (contents, origin, origin.template_name, self.engine)
+
+        with contextlib.suppress(FileNotFoundError):
+            return PrecompiledTemplate(path.read_text(encoding="utf-8"), *args)
+
+        template = Template(*args)
+        if all(map(is_constant, template.nodelist)):
+            text = template.render(Context(autoescape=self.engine.autoescape))
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, path)
+        return template
+
+
+class Loader(cached.Loader, _PrecompiledLoader):
+    def __init__(self, engine, loaders, cache_dir: Union[str, Path]):
+        self.cache_dir = Path(cache_dir)
+        super().__init__(engine, loaders)
@@ -0,0 +1,79 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Components rendered in the current response.
+
+Tags and widgets add the components they render, so later tags (the md2
+scripts for example) only emit what the response needs. The set lives in a
+context variable and is reset when a request starts.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import FrozenSet, Iterator, Optional, Set
+
+from django.core.signals import request_started
+
+__all__ = ["add", "capture", "collected", "reset"]
+
+_needs: ContextVar[Optional[Set[str]]] = ContextVar("neom_needs", default=None)
+
+
+def add(*names: str):
+    needs = _needs.get()
+    if needs is None:
+        needs = set()
+        _needs.set(needs)
+    needs.update(names)
+
+
+def collected() -> FrozenSet[str]:
+    return frozenset(_needs.get() or ())
+
+
+@contextmanager
+def capture() -> Iterator[Set[str]]:
+    """Collect the components added inside the block apart from the rest.
+
+    They are added to the enclosing set when the block exits.
+    """
+    captured: Set[str] = set()
+    token = _needs.set(captured)
+    try:
+        yield captured
+    finally:
+        _needs.reset(token)
+        add(*captured)
+
+
+def reset(*_, **__):
+    _needs.set(None)
+
+
+request_started.connect(reset, dispatch_uid="neom_needs_reset")
@@ -0,0 +1,90 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Render Django templates as a stream of chunks.
+
+Each top-level node of the root template, after following ``extends``, is
+rendered and yielded on its own. The text and tags before the first block,
+usually the whole ``<head>``, go out before the blocks run their queries.
+"""
+
+from typing import Any, Dict, Iterator, Optional
+
+from django.http import HttpRequest
+from django.template import Context
+from django.template.backends.django import Template as BackendTemplate
+from django.template.base import Template
+from django.template.context import make_context
+from django.template.loader_tags import (
+    BLOCK_CONTEXT_KEY,
+    BlockContext,
+    BlockNode,
+    ExtendsNode,
+)
+
+__all__ = ["stream"]
+
+
+def _nodes(template: Template, context: Context) -> Iterator[str]:
+    for node in template.nodelist:
+        if not isinstance(node, ExtendsNode):
+            yield node.render_annotated(context)
+            continue
+
+        parent = node.get_parent(context)
+        if BLOCK_CONTEXT_KEY not in context.render_context:
+            context.render_context[BLOCK_CONTEXT_KEY] = BlockContext()
+        block_context = context.render_context[BLOCK_CONTEXT_KEY]
+        block_context.add_blocks(node.blocks)
+        if not any(isinstance(n, ExtendsNode) for n in parent.nodelist):
+            block_context.add_blocks(
+                {
+                    block.name: block
+                    for block in parent.nodelist.get_nodes_by_type(BlockNode)
+                }
+            )
+        with context.render_context.push_state(parent, isolated_context=False):
+            yield from _nodes(parent, context)
+        return
+
+
+def stream(
+    template: BackendTemplate,
+    context: Optional[Dict[str, Any]] = None,
+    request: Optional[HttpRequest] = None,
+) -> Iterator[str]:
+    """Render a template of the Django backend chunk by chunk."""
+    compiled = template.template
+    ctx = make_context(
+        context, request, autoescape=template.backend.engine.autoescape
+    )
+    state = ctx.render_context.push_state(compiled)
+    with state, ctx.bind_template(compiled):
+        ctx.template_name = compiled.name
+        yield from _nodes(compiled, ctx)
@@ -0,0 +1,96 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from neom.kit.md2 import assets, treeshake
+
+
+class Command(BaseCommand):
+    help = (
+        'Render md2 assets into content-hashed files in NEOM_MD2["BUILD_DIR"].'
+        " Run it before collectstatic."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--prune",
+            default=False,
+            action="store_true",
+            help="Keep only the stylesheet rules for the classes in use",
+        )
+        parser.add_argument(
+            "--split",
+            default=False,
+            action="store_true",
+            help="Write the script as per-component chunks too",
+        )
+        parser.add_argument(
+            "--icons",
+            default=False,
+            action="store_true",
+            help="Subset the icons font to the ligatures in use",
+        )
+        parser.add_argument(
+            "--icon",
+            action="append",
+            default=[],
+            help="Icon ligature to keep besides the ones found in templates",
+        )
+        parser.add_argument(
+            "paths",
+            nargs="*",
+            type=Path,
+            help="Extra sources to index when pruning or subsetting",
+        )
+
+    def handle(self, *args, **options):
+        paths = options["paths"]
+        used = treeshake.used_names(paths) if options["prune"] else None
+        icons = (
+            treeshake.used_icons(paths) | set(options["icon"])
+            if options["icons"] or options["icon"]
+            else None
+        )
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Build md2 assets:"))
+        data = assets.build(used=used, icons=icons, split=options["split"])
+        for name, entry in data["assets"].items():
+            self.stdout.write(
+                f"  {name} -> {entry['path']} ({entry['size']} bytes)"
+            )
+            if "fullsize" in entry:
+                saved = entry["fullsize"] - entry["size"]
+                self.stdout.write(
+                    f"    pruned {saved} of {entry['fullsize']} bytes"
+                    f" ({saved / entry['fullsize']:.0%})"
+                )
+        self.stdout.write(self.style.SUCCESS(f"  {assets.MANIFEST_NAME}"))
@@ -0,0 +1,113 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.template import Context, Engine
+
+DJANGO_SOURCE = (
+    "{% load neom_md2 %}{% for label in labels %}"
+    "{% neom_md2_card_outlined %}{% neom_md2_button_text label %}"
+    "{% neom_md2_card_actions %}"
+    "{% neom_md2_card_action_link label link %}{% end %}"
+    "<span class=\"{% _kt 'mdc-card__primary-action' %}\"></span>"
+    "{% end %}{% endfor %}"
+)
+
+JINJA_SOURCE = (
+    "{% for label in labels %}"
+    "{% neom_md2_card_outlined %}{% neom_md2_button_text label %}"
+    "{% neom_md2_card_actions %}"
+    "{% neom_md2_card_action_link label, link %}{% end %}"
+    "<span class=\"{% _kt 'mdc-card__primary-action' %}\"></span>"
+    "{% end %}{% endfor %}"
+)
+
+
+class Command(BaseCommand):
+    help = "Compare md2 rendering in the Django and Jinja2 engines."
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--cards",
+            type=int,
+            default=50,
+            help="Cards on the sample page",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=100,
+            help="Runs to average",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            from jinja2 import Environment
+        except ImportError as error:
+            raise CommandError(
+                "jinja2 package not installed, install neompy-et[jinja]"
+            ) from error
+
+        from neom.kit.md2.jinja import Md2Extension
+
+        django_template = Engine(
+            libraries={"neom_md2": "neom.kit.md2.templatetags.neom_md2"},
+            builtins=["neom.templatetags.neom_webtools"],
+        ).from_string(DJANGO_SOURCE)
+        jinja_template = Environment(
+            autoescape=True, extensions=[Md2Extension]
+        ).from_string(JINJA_SOURCE)
+
+        data = {
+            "labels": [f"Card {i % 10}" for i in range(options["cards"])],
+            "link": "/cards/",
+        }
+        renders = {
+            "django": lambda: django_template.render(Context(data)),
+            "jinja2": lambda: jinja_template.render(data),
+        }
+
+        outputs = {name: render() for name, render in renders.items()}
+        if outputs["django"] != outputs["jinja2"]:
+            raise CommandError("Engines render different md2 output")
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Render md2 page:"))
+        for name, render in renders.items():
+            start = time.perf_counter()
+            for _ in range(options["repeat"]):
+                render()
+            elapsed = (time.perf_counter() - start) / options["repeat"]
+            self.stdout.write(f"  {name}: {elapsed * 1e3:.3f} ms")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"  same output ({len(outputs['django'])} chars)"
+            )
+        )
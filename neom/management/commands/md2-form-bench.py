@@ -0,0 +1,84 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandParser
+from django.forms import models as model_forms
+
+from neom.kit.md2.forms import models as md2_model_forms
+from neom.kit.md2.views.generic.edit import UpdateView
+
+
+class Command(BaseCommand):
+    help = "Measure md2 UpdateView form building per request."
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument("model", help="Model as app_label.ModelName")
+        parser.add_argument(
+            "--fields",
+            default="__all__",
+            help="Comma separated form fields",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=1000,
+            help="Requests to simulate",
+        )
+
+    def handle(self, *args, **options):
+        model = apps.get_model(options["model"])
+        fields = options["fields"]
+        if fields != "__all__":
+            fields = fields.split(",")
+        view = UpdateView(model=model, fields=fields)
+
+        def uncached():
+            return model_forms.modelform_factory(
+                model,
+                md2_model_forms.ModelForm,
+                fields=fields,
+                formfield_callback=view._formfield_callback,
+            )
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Build md2 forms:"))
+        for name, get_form_class in (
+            ("before", uncached),
+            ("after", view.get_form_class),
+        ):
+            start = time.perf_counter()
+            for _ in range(options["repeat"]):
+                get_form_class()(instance=model())
+            elapsed = (time.perf_counter() - start) / options["repeat"]
+            self.stdout.write(
+                f"  {name}: {elapsed * 1e6:.1f} us,"
+                f" {1 / elapsed:.0f} requests/s"
+            )
@@ -0,0 +1,78 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from neom.kit.md2 import usage
+from neom.templatetags import neom_webtools
+
+
+class Command(BaseCommand):
+    help = "Generate the keytoken manifest from templates and md2 tags."
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "paths",
+            nargs="*",
+            type=Path,
+            help="Project templates or sources to scan besides neom",
+        )
+        parser.add_argument(
+            "--output",
+            "-o",
+            type=Path,
+            default=getattr(settings, "NEOM_KEYTOKENS", None),
+            help="Manifest file (default: settings.NEOM_KEYTOKENS)",
+        )
+
+    def handle(self, *args, **options):
+        output = options["output"]
+        if not output:
+            raise CommandError("Set NEOM_KEYTOKENS or pass --output")
+
+        for path in options["paths"]:
+            if not path.exists():
+                raise CommandError(f"Invalid path: {path}")
+
+        names = usage.scan((usage.NEOM_DIR, *options["paths"]))
+        data = neom_webtools.manifest(names)
+
+        with open(output, "w") as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+            f.write("\n")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(data['keys'])} keytokens ({data['version']}) -> {output}"
+            )
+        )
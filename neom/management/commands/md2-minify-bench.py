@@ -0,0 +1,125 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import time
+
+from django import forms
+from django.core.management.base import BaseCommand, CommandParser
+from django.template.loader import render_to_string
+
+from neom.kit.md2 import minify
+from neom.kit.md2.forms import fields, widgets
+from neom.kit.md2.forms.models import Md2RenderableFormMixin
+
+
+class SampleForm(forms.Form, Md2RenderableFormMixin):
+    template_name_md2 = "neom/kit/md2/forms/md2.html"
+
+    name = fields.TextField(widget=widgets.TextInput)
+    email = fields.TextField(widget=widgets.TextInput)
+    group = fields.SelectField(
+        choices=[("a", "A"), ("b", "B")], widget=widgets.Select
+    )
+
+
+def sample_page(forms_count: int) -> str:
+    body = "".join(
+        f'  <form method="post">\n    {SampleForm(prefix=str(i)).as_md2()}'
+        "\n  </form>\n"
+        for i in range(forms_count)
+    )
+    return (
+        "<!DOCTYPE html>\n<html>\n<head>\n  <title>md2</title>\n</head>\n"
+        f"<body>\n{body}</body>\n</html>\n"
+    )
+
+
+class Command(BaseCommand):
+    help = "Measure the bytes saved and time spent minifying md2 pages."
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "templates",
+            nargs="*",
+            help="Templates to measure instead of the sample md2 form page",
+        )
+        parser.add_argument(
+            "--forms",
+            type=int,
+            default=10,
+            help="Forms on the sample page",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=4096,
+            help="Chunk size for the streaming run",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=100,
+            help="Runs to average",
+        )
+
+    def handle(self, *args, **options):
+        pages = {
+            name: render_to_string(name) for name in options["templates"]
+        } or {"sample": sample_page(options["forms"])}
+        size = options["chunk_size"]
+        repeat = options["repeat"]
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Minify md2 pages:"))
+        for name, html in pages.items():
+            bounds = range(0, len(html) + size, size)
+            chunks = [
+                html[start:stop] for start, stop in zip(bounds, bounds[1:])
+            ]
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                minified = minify.minify(html)
+            whole = (time.perf_counter() - start) / repeat
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                "".join(minify.minify_chunks(chunks))
+            streamed = (time.perf_counter() - start) / repeat
+
+            original = len(html.encode())
+            saved = original - len(minified.encode())
+            self.stdout.write(
+                f"  {name}: {original} bytes, saved {saved}"
+                f" ({saved / original:.0%})"
+            )
+            self.stdout.write(
+                f"    whole {whole * 1e3:.3f} ms,"
+                f" streamed {streamed * 1e3:.3f} ms"
+                f" ({streamed / len(chunks) * 1e6:.1f} us per chunk)"
+            )
@@ -0,0 +1,101 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import time
+
+from django import forms
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.forms.renderers import TemplatesSetting
+
+from neom.kit.md2.forms import fields, widgets
+from neom.kit.md2.forms.models import Md2RenderableFormMixin
+from neom.kit.md2.forms.renderers import Md2Renderer
+
+
+class SampleForm(forms.Form, Md2RenderableFormMixin):
+    template_name_md2 = "neom/kit/md2/forms/md2.html"
+
+    def __init__(self, *args, size: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        for i in range(size):
+            if i % 3:
+                self.fields[f"text{i}"] = fields.TextField(
+                    label=f"Text {i}", widget=widgets.TextInput
+                )
+            else:
+                self.fields[f"select{i}"] = fields.SelectField(
+                    label=f"Select {i}",
+                    choices=[("a", "A"), ("b", "B")],
+                    widget=widgets.Select,
+                )
+
+
+class Command(BaseCommand):
+    help = "Compare md2 form rendering through templates and compiled."
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--fields",
+            type=int,
+            default=40,
+            help="Fields on the sample form",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=50,
+            help="Runs to average",
+        )
+
+    def handle(self, *args, **options):
+        data = {f"text{i}": f"<value {i}>" for i in range(options["fields"])}
+        renders = {
+            name: SampleForm(data, size=options["fields"], renderer=renderer)
+            for name, renderer in (
+                ("templates", TemplatesSetting()),
+                ("compiled", Md2Renderer()),
+            )
+        }
+
+        outputs = {name: form.as_md2() for name, form in renders.items()}
+        if outputs["templates"] != outputs["compiled"]:
+            raise CommandError("Compiled md2 forms render different output")
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Render md2 form:"))
+        for name, form in renders.items():
+            start = time.perf_counter()
+            for _ in range(options["repeat"]):
+                form.as_md2()
+            elapsed = (time.perf_counter() - start) / options["repeat"]
+            self.stdout.write(f"  {name}: {elapsed * 1e3:.3f} ms")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"  same output ({len(outputs['templates'])} chars)"
+            )
+        )
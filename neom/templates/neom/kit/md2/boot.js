@@ -0,0 +1,129 @@
+{# Copyright Neomadas, Inc. All rights reserved. #}
+!function () {
+  "use strict";
+
+  // data-neom-md2 value to the mdc namespace and component class.
+  var components = {
+    ripple: ["ripple", "MDCRipple"],
+    select: ["select", "MDCSelect"],
+    textfield: ["textField", "MDCTextField"],
+  };
+
+  var selector = "[data-neom-md2]";
+
+  // Wait after the last keystroke before searching a lazy select source.
+  var SEARCH_DELAY_MS = 250;
+
+  function attach(element) {
+    var component = components[element.getAttribute("data-neom-md2")];
+    var namespace = component && window.mdc && window.mdc[component[0]];
+    if (namespace && !element.neomMd2) {
+      element.neomMd2 = new namespace[component[1]](element);
+      if (element.hasAttribute("data-neom-md2-source")) lazy(element);
+    }
+  }
+
+  // Load the options of a lazy select page by page from its source.
+  function lazy(element) {
+    var source = element.getAttribute("data-neom-md2-source");
+    var list = element.querySelector("[role=listbox]");
+    var menu = list.parentNode;
+    var search = menu.querySelector("input[type=search]");
+    var item = menu.querySelector("template").content.firstElementChild;
+    var query = "";
+    var after = null;
+    var started = false;
+    var done = false;
+    var loading = false;
+    var generation = 0;
+    var timer;
+
+    function load(reset) {
+      if (!reset && (done || loading)) return;
+      var current = ++generation;
+      var url = source + "?q=" + encodeURIComponent(query);
+      if (!reset && after !== null) {
+        url += "&after=" + encodeURIComponent(after);
+      }
+      loading = true;
+      fetch(url, {
+        credentials: "same-origin",
+        headers: { Accept: "application/json" },
+      })
+        .then(function (response) {
+          return response.json();
+        })
+        .then(function (page) {
+          if (current !== generation) return;
+          var selected = element.neomMd2.value;
+          if (reset) {
+            var stale = list.querySelectorAll("[aria-selected=false]");
+            stale.forEach(function (li) {
+              li.remove();
+            });
+          }
+          page.results.forEach(function (option) {
+            if (option.value === selected) return;
+            var li = item.cloneNode(true);
+            li.setAttribute("data-value", option.value);
+            li.lastElementChild.textContent = option.label;
+            list.appendChild(li);
+          });
+          after = page.after;
+          done = after === null;
+          loading = false;
+          element.neomMd2.layoutOptions();
+        })
+        .catch(function () {
+          if (current === generation) loading = false;
+        });
+    }
+
+    menu.addEventListener("MDCMenuSurface:opened", function () {
+      if (!started) {
+        started = true;
+        load(true);
+      }
+      if (search) search.focus();
+    });
+    menu.addEventListener("scroll", function () {
+      if (menu.scrollTop + menu.clientHeight >= menu.scrollHeight - 48) {
+        load(false);
+      }
+    });
+    if (search) {
+      search.addEventListener("keydown", function (event) {
+        event.stopPropagation();
+      });
+      search.addEventListener("input", function () {
+        clearTimeout(timer);
+        timer = setTimeout(function () {
+          query = search.value;
+          load(true);
+        }, SEARCH_DELAY_MS);
+      });
+    }
+  }
+
+  function attachAll(root) {
+    if (root.matches && root.matches(selector)) attach(root);
+    if (root.querySelectorAll) root.querySelectorAll(selector).forEach(attach);
+  }
+
+  function start() {
+    attachAll(document);
+    new MutationObserver(function (records) {
+      records.forEach(function (record) {
+        record.addedNodes.forEach(function (node) {
+          if (node.nodeType === Node.ELEMENT_NODE) attachAll(node);
+        });
+      });
+    }).observe(document.documentElement, { childList: true, subtree: true });
+  }
+
+  if (document.readyState === "loading") {
+    document.addEventListener("DOMContentLoaded", start);
+  } else {
+    start();
+  }
+}();
@@ -27,30 +27,49 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from django.template import Library, Node, TemplateSyntaxError
-from django.template.base import FilterExpression, Parser, Token
+import functools
+
+from django.template import Engine, Library, Node, TemplateSyntaxError
+from django.template.base import FilterExpression, Parser, Template, Token
 from django.template.loader_tags import construct_relative_path
+from django.utils.autoreload import file_changed
 
 register = Library()
 
+IMPORT_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=IMPORT_CACHE_SIZE)
+def _select(engine: Engine, fullpath: str) -> Template:
+    """Compiled template at ``fullpath``, shared across requests."""
+    return engine.select_template((fullpath,))
+
+
+def _template_changed(sender, file_path, **kwargs):
+    """Drop imported templates when the autoreloader sees a change."""
+    _select.cache_clear()
+
+
+file_changed.connect(_template_changed, dispatch_uid="neom_import_changed")
+
 
 class NeomImportNode(Node):
     def __init__(self, template: FilterExpression, *args, **kwargs):
         self.template = template
+        self.literal = not template.filters and isinstance(template.var, str)
+        self.selected = None
         super().__init__(*args, **kwargs)
 
     def render(self, context):
-        subpath = self.template.resolve(context)
-        fullpath = (
-            construct_relative_path(self.origin.template_name, subpath),
-        )
-
-        cache = context.render_context.dicts[0].setdefault(self, {})
-        template = cache.get(fullpath)
-
-        if not template:
-            template = context.template.engine.select_template(fullpath)
-            cache[fullpath] = template
+        template = self.selected
+        if template is None:
+            subpath = self.template.resolve(context)
+            fullpath = construct_relative_path(
+                self.origin.template_name, subpath
+            )
+            template = _select(context.template.engine, fullpath)
+            if self.literal:
+                self.selected = template
 
         return template.render(context)
 
@@ -28,17 +28,24 @@
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import functools
+import hashlib
+import json
+import os.path
 import string
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Tuple
 
 from django import template
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
 
 register = template.Library()
 
 CHS = string.ascii_lowercase
 CHSLEN = len(CHS)
-COUNT = -1
-KEYS: Dict[str, str] = {}
+
+MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "_keytokens.json")
 
 
 @functools.lru_cache(maxsize=1024)
@@ -46,16 +53,66 @@ def __keytoken(i: int):
     return __keytoken(i // CHSLEN - 1) + CHS[i % CHSLEN] if i + 1 else ""
 
 
+def keytokens(names: Iterable[str]) -> Dict[str, str]:
+    """Assign tokens to names in sorted order."""
+    return {s: __keytoken(i) for i, s in enumerate(sorted(set(names)))}
+
+
+def manifest(names: Iterable[str]) -> Dict:
+    keys = keytokens(names)
+    digest = hashlib.sha256(json.dumps(keys, sort_keys=True).encode())
+    return {"version": digest.hexdigest()[:12], "keys": keys}
+
+
+@functools.cache
+def _manifest() -> Tuple[str, Mapping[str, str]]:
+    """Version and keys of the keytoken manifest, read on first use."""
+    path = getattr(settings, "NEOM_KEYTOKENS", MANIFEST_PATH)
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except FileNotFoundError as error:
+        raise ImproperlyConfigured(
+            f"keytoken manifest not found: {path}."
+            " Run `manage.py md2-keytokens` to generate it."
+        ) from error
+    return data["version"], MappingProxyType(data["keys"])
+
+
+def __getattr__(name: str):
+    if name == "VERSION":
+        return _manifest()[0]
+    if name == "KEYS":
+        return _manifest()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def keytoken(s: str):
-    if s in KEYS:
-        return KEYS[s]
-    global COUNT
-    COUNT += 1
-    KEYS[s] = ktok = __keytoken(COUNT // CHSLEN - 1) + CHS[COUNT % CHSLEN]
-    return ktok
+    """Minified class name of ``s``.
+
+    Only meant for class names. Element ids derive from stable values like
+    the form prefix and field name, they must not go through here.
+    """
+    keys = _manifest()[1]
+    if s in keys:
+        return keys[s]
+    # Names out of the manifest get a token derived from the name itself, so
+    # every process agrees on it without a shared registry.
+    return "_" + hashlib.blake2b(s.encode(), digest_size=5).hexdigest()
 
 
 @register.simple_tag
-@functools.cache
+@functools.lru_cache(maxsize=2048)
 def _kt(s: str):
     return keytoken(s)
+
+
+def _settings_changed(sender, setting, **kwargs):
+    if setting == "NEOM_KEYTOKENS":
+        _manifest.cache_clear()
+        _kt.cache_clear()
+
+
+setting_changed.connect(
+    _settings_changed, dispatch_uid="neom_webtools_settings_changed"
+)
@@ -0,0 +1,73 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from pathlib import Path
+
+import pytest
+from django.utils.autoreload import file_changed
+
+from neom.kit.md2 import assets
+from neom.templatetags import neom_webtools
+
+BLOCKS = frozenset(("mdc-button",))
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    calls = []
+
+    def render_pruned(name, used):
+        calls.append(used)
+        return f"/* {len(calls)} */"
+
+    monkeypatch.setattr(assets, "render_pruned", render_pruned)
+    monkeypatch.setattr(neom_webtools, "VERSION", "v1", raising=False)
+    assets._critical.cache_clear()
+    yield calls
+    assets._critical.cache_clear()
+
+
+def test_critical_is_rendered_once(renders):
+    assert assets.critical(BLOCKS) == assets.critical(BLOCKS)
+    assert renders == [BLOCKS]
+
+
+def test_critical_follows_keytoken_version(renders, monkeypatch):
+    first = assets.critical(BLOCKS)
+    monkeypatch.setattr(neom_webtools, "VERSION", "v2")
+
+    assert assets.critical(BLOCKS) != first
+
+
+def test_file_changed_drops_critical(renders):
+    first = assets.critical(BLOCKS)
+
+    file_changed.send(sender=None, file_path=Path("web.css"))
+
+    assert assets.critical(BLOCKS) != first
@@ -0,0 +1,106 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from pathlib import Path
+
+import pytest
+from django import forms
+from django.contrib.auth.models import Group, Permission
+from django.test import RequestFactory
+from django.utils.autoreload import file_changed
+
+from neom.kit.md2.views.generic import edit
+
+
+def form_class(model, fields):
+    return edit.UpdateView(model=model, fields=fields).get_form_class()
+
+
+def test_form_class_is_built_once():
+    edit.modelform.cache_clear()
+
+    first = form_class(Group, ["name"])
+
+    assert form_class(Group, ["name"]) is first
+    assert form_class(Group, ("name",)) is first
+    assert edit.modelform.cache_info().misses == 1
+
+
+def test_form_class_depends_on_model_and_fields():
+    group_name = form_class(Group, ["name"])
+
+    assert form_class(Group, ["name", "permissions"]) is not group_name
+    assert form_class(Permission, ["name"]) is not group_name
+    assert list(form_class(Group, ["name"]).base_fields) == ["name"]
+
+
+def test_file_changed_clears_form_classes():
+    first = form_class(Group, ["name"])
+
+    file_changed.send(sender=None, file_path=Path("models.py"))
+
+    assert edit.modelform.cache_info().currsize == 0
+    assert form_class(Group, ["name"]) is not first
+
+
+class TextareaBulkUpdateView(edit.BulkUpdateView):
+    model = Group
+    fields = ["name"]
+    paginate_by = 2
+
+    @staticmethod
+    def _formfield_callback(field, **kwargs):
+        return forms.CharField(widget=forms.Textarea, **kwargs)
+
+
+@pytest.fixture
+def groups(django_db):
+    names = ["a", "b", "c", "d", "e"]
+    Group.objects.bulk_create(Group(name=name) for name in names)
+    yield names
+    Group.objects.all().delete()
+
+
+def test_bulk_form_class_uses_view_formfield_callback():
+    formset = TextareaBulkUpdateView().get_form_class()
+
+    assert isinstance(formset.form.base_fields["name"].widget, forms.Textarea)
+
+
+@pytest.mark.parametrize(
+    ("page", "expected"), [("1", ["a", "b"]), ("3", ["e"]), ("x", ["a", "b"])]
+)
+def test_bulk_update_edits_one_page(groups, page, expected):
+    view = TextareaBulkUpdateView()
+    view.setup(RequestFactory().get("/", {"page": page}))
+
+    formset = view.get_form()
+
+    assert [form.instance.name for form in formset] == expected
+    assert view.get_context_data(form=formset)["page_obj"].paginator.count == 5
@@ -0,0 +1,113 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pytest
+from django.template import engines
+
+from neom.kit.template import needs
+
+jinja2 = pytest.importorskip("jinja2")
+
+from neom.kit.md2.jinja import Md2Extension  # noqa: E402
+
+DJANGO_LOAD = "{% load neom_md2 neom_webtools %}"
+
+# Each case in Django then Jinja syntax.
+CASES = {
+    "literal single": (
+        "{% neom_md2_button_text 'Save' %}",
+        "{% neom_md2_button_text 'Save' %}",
+    ),
+    "variable single": (
+        "{% neom_md2_button_outlined label %}"
+        "{% neom_md2_button_contained label %}",
+        "{% neom_md2_button_outlined label %}"
+        "{% neom_md2_button_contained label %}",
+    ),
+    "keytokens": (
+        "<i class=\"{% _kt 'mdc-button' %} {% _kt name %}\"></i>",
+        "<i class=\"{% _kt 'mdc-button' %} {% _kt name %}\"></i>",
+    ),
+    "compose": (
+        "{% neom_md2_card_outlined %}<p>{{ label }}</p>"
+        "{% neom_md2_card_actions_full_bleed %}"
+        "{% neom_md2_card_action_button 'Open' %}{% end %}{% end %}",
+        "{% neom_md2_card_outlined %}<p>{{ label }}</p>"
+        "{% neom_md2_card_actions_full_bleed %}"
+        "{% neom_md2_card_action_button 'Open' %}{% end %}{% end %}",
+    ),
+    "loop": (
+        "{% for label in labels %}{% neom_md2_card_elevated %}"
+        "{% neom_md2_card_actions %}"
+        "{% neom_md2_card_action_link label link %}"
+        "{% end %}{% end %}{% endfor %}",
+        "{% for label in labels %}{% neom_md2_card_elevated %}"
+        "{% neom_md2_card_actions %}"
+        "{% neom_md2_card_action_link label, link %}"
+        "{% end %}{% end %}{% endfor %}",
+    ),
+}
+
+DATA = {
+    "label": "Card <1>",
+    "labels": ["One", "Two", "One"],
+    "link": "/cards/?a=1&b=2",
+    "name": "mdc-card",
+}
+
+
+@pytest.fixture(scope="module")
+def environment():
+    return jinja2.Environment(autoescape=True, extensions=[Md2Extension])
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_jinja_renders_as_django(environment, name):
+    django_source, jinja_source = CASES[name]
+    django_template = engines["django"].from_string(DJANGO_LOAD + django_source)
+    jinja_template = environment.from_string(jinja_source)
+
+    with needs.capture() as django_needs:
+        django_output = django_template.render(DATA)
+    with needs.capture() as jinja_needs:
+        jinja_output = jinja_template.render(DATA)
+
+    assert jinja_output == django_output
+    assert jinja_needs == django_needs
+
+
+def test_jinja_exposes_single_tags_as_globals(environment):
+    django_template = engines["django"].from_string(
+        DJANGO_LOAD + "{% neom_md2_button_text label %}"
+    )
+    jinja_template = environment.from_string(
+        "{{ neom_md2_button_text(label) }}"
+    )
+
+    assert jinja_template.render(DATA) == django_template.render(DATA)
@@ -0,0 +1,84 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pytest
+from django.contrib.auth.models import Group
+from django.core import signing
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+from django.http import Http404
+from django.test import RequestFactory
+
+from neom.kit.md2.views.generic import list as md2_list
+
+
+class Event(models.Model):
+    day = models.DateField(db_index=True)
+    closed = models.DateField(null=True, db_index=True)
+    note = models.CharField(max_length=20)
+
+    class Meta:
+        app_label = "neom"
+
+
+def test_as_view_accepts_indexed_columns():
+    assert md2_list.ListView.as_view(
+        model=Event, ordering="-day", sortable=("day",)
+    )
+
+
+@pytest.mark.parametrize(
+    "initkwargs",
+    [
+        {"sortable": ("note",)},
+        {"sortable": ("closed",)},
+        {"ordering": "-closed"},
+    ],
+)
+def test_as_view_rejects_unsortable_columns(initkwargs):
+    with pytest.raises(ImproperlyConfigured):
+        md2_list.ListView.as_view(model=Event, **initkwargs)
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "garbage",
+        signing.dumps(
+            (("None", "None"), "pk", False), salt=md2_list.CURSOR_SALT
+        ),
+    ],
+    ids=["unsigned", "unparsable-key"],
+)
+def test_invalid_cursor_is_not_found(token):
+    view = md2_list.ListView.as_view(model=Group, columns=("name",))
+    request = RequestFactory().get("/", {"cursor": token})
+
+    with pytest.raises(Http404):
+        view(request)
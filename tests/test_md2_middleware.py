@@ -0,0 +1,76 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from neom.kit.md2 import assets, middleware
+
+LINKS = ["</static/web.css>; rel=preload; as=style"]
+
+HTML = "text/html,application/xhtml+xml,*/*;q=0.8"
+
+
+@pytest.fixture
+def hints(monkeypatch):
+    monkeypatch.setattr(assets, "preloads", lambda used=(): list(LINKS))
+    with override_settings(NEOM_MD2={"ASSETS": "static"}):
+        yield []
+
+
+def preload(path, accept, hints):
+    request = RequestFactory().get(path, HTTP_ACCEPT=accept)
+    request.META["wsgi.early_hints"] = hints.append
+    return middleware.PreloadMiddleware(
+        lambda request: HttpResponse(content_type="application/json")
+    )(request)
+
+
+def test_page_navigation_gets_early_hints(hints):
+    preload("/orders/", HTML, hints)
+
+    assert hints == [[("Link", link) for link in LINKS]]
+
+
+@pytest.mark.parametrize(
+    ("path", "accept"),
+    [
+        ("/orders/", "application/json"),
+        ("/orders/", "*/*"),
+        ("/static/web.css", HTML),
+        ("/md2/web.js", HTML),
+        ("/md2/choices/users/", HTML),
+    ],
+)
+def test_other_requests_get_no_early_hints(hints, path, accept):
+    response = preload(path, accept, hints)
+
+    assert hints == []
+    assert not response.has_header("Link")
@@ -0,0 +1,84 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pytest
+
+from neom.kit.md2 import assets, minify
+
+PAGE = f"""<!DOCTYPE html>
+<html>
+  <head>
+    <title> md2   page </title>
+    {assets.CRITICAL_MARKER}
+    <!--[if IE]><p>old</p><![endif]-->
+    <!-- dropped -->
+    <style>
+      .a  {{ color: red }}
+    </style>
+  </head>
+  <body>
+    <div   class="x  y"   data-a='1  2'>
+      <span> a </span>   <b>b</b>
+    </div>
+    <pre>  keep
+      this  </pre>
+    <textarea name="t">  as   is </textarea>
+    <script>
+      if (a  <  b) {{ c() }}
+    </script>
+    <SVG viewBox="0 0 10 10"><Path d="M 0 0"/></SVG>
+  </body>
+</html>
+"""
+
+
+def chunked(text: str, size: int):
+    bounds = range(0, len(text) + size, size)
+    return [text[start:stop] for start, stop in zip(bounds, bounds[1:])]
+
+
+def test_minify_drops_whitespace_and_comments():
+    html = minify.minify(PAGE)
+
+    assert len(html) < len(PAGE)
+    assert "dropped" not in html
+    assert assets.CRITICAL_MARKER in html
+    assert "<!--[if IE]>" in html
+    assert "<pre>  keep\n      this  </pre>" in html
+    assert "  as   is " in html
+    assert "a  <  b" in html
+    assert "<SVG" in html
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 13, 64, 4096])
+def test_minify_chunks_matches_whole(size):
+    whole = minify.minify(PAGE)
+    streamed = "".join(minify.minify_chunks(chunked(PAGE, size)))
+
+    assert streamed == whole
@@ -0,0 +1,91 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from typing import List
+
+import pytest
+from django import forms
+from django.contrib.auth.models import Group
+from django.forms.renderers import TemplatesSetting
+
+from neom.kit.md2.forms import fields as md2_fields
+from neom.kit.md2.forms import models as md2_model_forms
+from neom.kit.md2.forms import renderers
+from neom.kit.md2.forms import widgets as md2_widgets
+
+
+class GroupForm(md2_model_forms.ModelForm):
+    name = md2_fields.TextField(
+        max_length=150,
+        widget=md2_widgets.TextInput(attrs={"placeholder": "Team <name>"}),
+    )
+    level = md2_fields.SelectField(
+        choices=[(1, "Low"), (2, "High & mighty")],
+        coerce=int,
+        widget=md2_widgets.Select,
+    )
+    token = forms.CharField(required=False, widget=forms.HiddenInput)
+
+    class Meta:
+        model = Group
+        fields: List[str] = []
+
+
+FORMS = {
+    "unbound": lambda renderer: GroupForm(
+        initial={"name": "ops", "level": 2}, renderer=renderer
+    ),
+    "invalid": lambda renderer: GroupForm(
+        data={"name": "", "level": "3", "token": "t"}, renderer=renderer
+    ),
+    "valid": lambda renderer: GroupForm(
+        data={"name": 'a "quoted" <b>', "level": "1"}, renderer=renderer
+    ),
+}
+
+
+def test_renderer_compiles_md2_templates():
+    renderer = renderers.Md2Renderer()
+
+    for name in (
+        GroupForm.template_name_md2,
+        md2_widgets.TextInput.template_name,
+        md2_widgets.Select.template_name,
+    ):
+        assert isinstance(
+            renderer.get_template(name), renderers.CompiledTemplate
+        )
+
+
+@pytest.mark.parametrize("case", FORMS)
+def test_renderer_matches_templates_setting(case):
+    stock = FORMS[case](TemplatesSetting())
+    compiled = FORMS[case](renderers.Md2Renderer())
+
+    assert compiled.as_md2() == stock.as_md2()
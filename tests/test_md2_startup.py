@@ -0,0 +1,139 @@
+# Copyright 2023 neomadas-dev
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   1. Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#   2. Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+#
+#   3. Neither the name of the copyright holder nor the names of its
+#      contributors may be used to endorse or promote products derived from
+#      this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Bytes held by code under neom/ after importing neom and the md2 tags. The
+# baseline before the import was trimmed held about 180 KB, now about 47 KB.
+IMPORT_BUDGET = 96 * 1024
+
+IMPORT_PROBE = """
+import json
+import os
+import tracemalloc
+
+import django
+
+
+def held(snapshot):
+    pattern = os.path.join(os.path.dirname(neom.__file__), "*")
+    own = snapshot.filter_traces([tracemalloc.Filter(True, pattern)])
+    return sum(stat.size for stat in own.statistics("filename"))
+
+
+tracemalloc.start()
+import neom
+
+package = held(tracemalloc.take_snapshot())
+tracemalloc.stop()
+
+django.setup()
+
+tracemalloc.start()
+import neom.kit.md2
+from neom.kit.md2.templatetags import neom_md2
+
+print(json.dumps({
+    "neom_bytes": package + held(tracemalloc.take_snapshot()),
+}))
+"""
+
+PROBE = """
+import json
+import sys
+import tracemalloc
+
+import django
+
+django.setup()
+tracemalloc.start()
+
+from neom.kit.md2.templatetags import _icons, neom_md2
+
+snapshot = tracemalloc.take_snapshot()
+icons = snapshot.filter_traces([tracemalloc.Filter(True, _icons.__file__)])
+print(json.dumps({
+    "raw": _icons.raw.cache_info().currsize,
+    "content": _icons._content.cache_info().currsize,
+    "icons_bytes": sum(stat.size for stat in icons.statistics("filename")),
+    "modules": sorted(
+        name
+        for name in (
+            "brotli",
+            "fontTools",
+            "neom.kit.md2.fonts",
+            "neom.kit.md2.jssplit",
+            "neom.kit.md2.treeshake",
+            "neom.kit.md2.usage",
+        )
+        if name in sys.modules
+    ),
+}))
+"""
+
+
+def run(probe: str) -> dict:
+    """Output of ``probe`` run by a fresh interpreter."""
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": "tests.settings",
+        "PYTHONPATH": os.pathsep.join(
+            filter(None, [str(ROOT), os.environ.get("PYTHONPATH")])
+        ),
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        check=True,
+        cwd=ROOT,
+        env=env,
+        text=True,
+    )
+    return json.loads(result.stdout)
+
+
+def test_import_neom_md2_stays_in_budget():
+    probe = run(IMPORT_PROBE)
+
+    assert probe["neom_bytes"] < IMPORT_BUDGET
+
+
+def test_import_neom_md2_leaves_icons_and_build_modules_unloaded():
+    probe = run(PROBE)
+
+    assert probe["raw"] == 0
+    assert probe["content"] == 0
+    assert probe["icons_bytes"] < 16 * 1024
+    assert probe["modules"] == []